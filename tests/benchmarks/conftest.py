@@ -0,0 +1,129 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from httpx import AsyncClient, Response
+
+from tests import seed
+from tests.conftest import committed_database
+
+
+def percentile(latencies: list, percent: float) -> float:
+    index = max(int(len(latencies) * percent / 100) - 1, 0)
+    return latencies[index]
+
+
+@pytest.fixture(scope='session')
+def bench_config(pytestconfig) -> dict:
+    return {
+        "requests": pytestconfig.getoption("bench_requests"),
+        "concurrency": pytestconfig.getoption("bench_concurrency"),
+        "seed": pytestconfig.getoption("bench_seed"),
+        "tolerance": pytestconfig.getoption("bench_tolerance"),
+    }
+
+
+@pytest.fixture(scope='session')
+def bench_baseline(pytestconfig) -> dict:
+    path = pytestconfig.getoption("bench_baseline")
+    if path is None:
+        return dict()
+    with open(path) as file:
+        return json.load(file)
+
+
+@pytest.fixture(scope='session')
+def bench_results(pytestconfig):
+    results = dict()
+    yield results
+    with open(pytestconfig.getoption("bench_output"), "w") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+
+@pytest.fixture(scope='package', autouse=True)
+async def bench_db(db_url):
+    # endpoints are measured on a real pool, the shared rollback session would only measure queueing
+    async with committed_database(db_url) as pool_db:
+        yield pool_db
+
+
+@pytest.fixture(scope='package')
+def bench_store(bench_db):
+    # ids shared between benchmarks of one flow, they live as long as the rows in bench_db
+    return dict()
+
+
+@pytest.fixture(scope='session')
+def bench(bench_config, bench_baseline, bench_results):
+    async def __run(name: str, send_request, expected_status: int = 200, concurrency: int = None) -> dict:
+        """
+        Fire send_request(i) for i in range(requests) with at most
+        concurrency requests in flight (--bench-concurrency unless given),
+        record latency stats under name and check them against the baseline.
+        """
+        concurrency = concurrency or bench_config["concurrency"]
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies = []
+
+        async def timed(i: int) -> Response:
+            async with semaphore:
+                start = time.perf_counter()
+                response = await send_request(i)
+                latencies.append(time.perf_counter() - start)
+                return response
+
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(timed(i) for i in range(bench_config["requests"])))
+        elapsed = time.perf_counter() - start
+
+        assert all(response.status_code == expected_status for response in responses), name
+        latencies.sort()
+        stats = {
+            "requests": len(latencies),
+            "concurrency": concurrency,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "rps": len(latencies) / elapsed,
+        }
+        bench_results[name] = stats
+
+        baseline = bench_baseline.get(name)
+        if baseline is not None:
+            tolerance = bench_config["tolerance"]
+            assert stats["p95_ms"] <= baseline["p95_ms"] * (1 + tolerance), f"{name} p95 regressed"
+            assert stats["rps"] >= baseline["rps"] * (1 - tolerance), f"{name} throughput regressed"
+        return stats
+
+    return __run
+
+
+@pytest.fixture(scope='package')
+async def bench_users(ac: AsyncClient, bench_config, bench_store) -> list:
+    # real accounts, one per request plus a company owner, created through the bulk endpoint
+    emails = [f"bench{i}@bench.com" for i in range(bench_config["requests"] + 1)]
+    payload = [
+        {
+            "user_password": "bench",
+            "user_password_repeat": "bench",
+            "user_email": email,
+            "user_name": email.split("@")[0],
+        }
+        for email in emails
+    ]
+    response = await ac.post("/users/bulk", json=payload)
+    assert response.status_code == 200
+    bench_store["users_ids"] = [row.get("user_id") for row in response.json().get("result")]
+    return emails
+
+
+@pytest.fixture(scope='package')
+async def bench_seed(bench_db, bench_config, db_template) -> int:
+    # a cloned template already holds the volume, otherwise COPY it in for this package
+    async with bench_db.connection() as connection:
+        if db_template is not None:
+            return await seed.count_users(connection.raw_connection, seed.TEMPLATE_PREFIX)
+        await seed.copy_users(connection.raw_connection, "bench_seed", bench_config["seed"])
+    return bench_config["seed"]
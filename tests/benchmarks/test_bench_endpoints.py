@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from httpx import AsyncClient
+
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope='module')
+def auth(users_tokens, bench_users):
+    def __headers(i: int) -> dict:
+        return {
+            "Authorization": f"Bearer {users_tokens[bench_users[i]]}",
+        }
+
+    return __headers
+
+
+async def test_bench_login(bench, bench_users, bench_store, login_user):
+    async def send_request(i: int):
+        return await login_user(bench_users[i], "bench")
+
+    await bench("auth_login", send_request)
+    owner = len(bench_users) - 1
+    response = await login_user(bench_users[owner], "bench")
+    assert response.status_code == 200
+    bench_store["owner"] = owner
+
+
+async def test_bench_auth_me(ac: AsyncClient, bench, auth):
+    async def send_request(i: int):
+        return await ac.get("/auth/me/", headers=auth(i))
+
+    await bench("auth_me", send_request)
+
+
+async def test_bench_users_list(ac: AsyncClient, bench, auth, bench_seed):
+    async def send_request(i: int):
+        return await ac.get("/users/", headers=auth(i))
+
+    await bench("users_list", send_request)
+
+
+async def test_bench_invite_accept(ac: AsyncClient, bench, bench_store, auth):
+    owner = bench_store["owner"]
+    response = await ac.post("/company/", json={"company_name": "bench_invites"}, headers=auth(owner))
+    assert response.status_code == 201
+    company_id = response.json().get("result").get("company_id")
+    bench_store["company_id"] = company_id
+    payload = {
+        "from_company_id": company_id,
+        "to_user_ids": bench_store["users_ids"][:owner],
+        "invite_message": "bench"
+    }
+    response = await ac.post("/invite/bulk", json=payload, headers=auth(owner))
+    assert response.status_code == 200
+    invites = await asyncio.gather(*(ac.get("/invite/my", headers=auth(i)) for i in range(owner)))
+    invites_ids = [response.json().get('result')[0].get('invite_id') for response in invites]
+
+    async def send_request(i: int):
+        return await ac.get(f"/invite/{invites_ids[i]}/accept/", headers=auth(i))
+
+    await bench("invite_accept", send_request)
+
+
+async def test_bench_company_members(ac: AsyncClient, bench, bench_store, auth):
+    async def send_request(i: int):
+        return await ac.get(f"/company/{bench_store['company_id']}/members", headers=auth(i))
+
+    await bench("company_members", send_request)
+
+
+async def test_bench_request_accept(ac: AsyncClient, bench, bench_store, auth):
+    owner = bench_store["owner"]
+    response = await ac.post("/company/", json={"company_name": "bench_requests"}, headers=auth(owner))
+    assert response.status_code == 201
+    company_id = response.json().get("result").get("company_id")
+    payload = {
+        "to_company_id": company_id,
+        "invite_message": "bench"
+    }
+    await asyncio.gather(*(ac.post("/request/", json=payload, headers=auth(i)) for i in range(owner)))
+    requests = await asyncio.gather(*(ac.get("/request/my", headers=auth(i)) for i in range(owner)))
+    requests_ids = [response.json().get('result')[0].get('request_id') for response in requests]
+
+    async def send_request(i: int):
+        return await ac.get(f"/request/{requests_ids[i]}/accept/", headers=auth(owner))
+
+    await bench("request_accept", send_request)
@@ -0,0 +1,35 @@
+import pytest
+
+from httpx import AsyncClient
+
+from tests import seed
+
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope='module')
+async def search_seed(bench_db, db_template, pytestconfig) -> dict:
+    async with bench_db.connection() as connection:
+        if db_template is not None:
+            return {"prefix": seed.TEMPLATE_PREFIX, "count": await seed.count_users(connection.raw_connection, seed.TEMPLATE_PREFIX)}
+        count = pytestconfig.getoption("bench_search_seed")
+        await seed.copy_users(connection.raw_connection, "bench_search", count)
+    await bench_db.execute("ANALYZE")
+    return {"prefix": "bench_search", "count": count}
+
+
+async def test_bench_users_search(ac: AsyncClient, bench, create_user, login_user, users_tokens, search_seed, pytestconfig):
+    await create_user("bench_search@bench.com", "bench", "bench_search")
+    await login_user("bench_search@bench.com", "bench")
+    headers = {
+        "Authorization": f"Bearer {users_tokens['bench_search@bench.com']}",
+    }
+
+    async def send_request(i: int):
+        params = {"q": f"{search_seed['prefix']}_{i * 7919 % search_seed['count']}", "limit": 20}
+        return await ac.get("/users/search", params=params, headers=headers)
+
+    # one request at a time, so the budget is spent on the query and not on queueing for connections
+    stats = await bench("users_search", send_request, concurrency=1)
+    assert stats["p95_ms"] < pytestconfig.getoption("bench_search_limit")
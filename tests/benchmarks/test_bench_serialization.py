@@ -0,0 +1,53 @@
+import time
+
+import pytest
+from starlette.responses import JSONResponse
+
+from core.responses import FastJSONResponse
+
+
+pytestmark = pytest.mark.benchmark
+
+LISTING_USERS = 10_000
+ROUNDS = 20
+
+
+def listing() -> dict:
+    return {
+        "status_code": 200,
+        "detail": "success",
+        "result": {
+            "users": [
+                {
+                    "user_id": i,
+                    "user_name": f"user_{i}",
+                    "user_email": f"user_{i}@bench.com",
+                    "user_password": None,
+                }
+                for i in range(LISTING_USERS)
+            ],
+            "next_cursor": None,
+        },
+    }
+
+
+def render_ms(response_class, content: dict) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        response_class(content)
+        timings.append(time.perf_counter() - start)
+    return sorted(timings)[ROUNDS // 2] * 1000
+
+
+def test_bench_serialization(bench_results):
+    pytest.importorskip("orjson")
+    content = listing()
+    default_ms = render_ms(JSONResponse, content)
+    fast_ms = render_ms(FastJSONResponse, content)
+    bench_results["serialize_users_10k"] = {
+        "default_ms": default_ms,
+        "fast_ms": fast_ms,
+        "speedup": default_ms / fast_ms,
+    }
+    assert fast_ms < default_ms
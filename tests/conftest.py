@@ -1,9 +1,15 @@
 import asyncio
+import os
+import re
 import pytest
 
+from contextlib import asynccontextmanager
+from itertools import count
 from typing import AsyncGenerator
 from starlette.testclient import TestClient
 from databases import Database
+from sqlalchemy import Table
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.pool import NullPool
 
@@ -16,9 +22,57 @@ from db.models import Base
 # import your test urls for db
 from core.config import system_config
 # import your get_db func
-from core.connections import get_db
+from core.connections import get_db, make_db
 
-test_db: Database = Database(system_config.db_url_test, force_rollback=True)
+from tests import seed
+
+# numbered files build on each other's data, everything else cleans up after itself
+CHAIN_FILE = re.compile(r"^test_\d+_\w+\.py$")
+
+# set by pytest-xdist, None for a plain run
+worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark")
+    group.addoption("--bench-requests", type=int, default=500, help="requests fired per benchmarked endpoint")
+    group.addoption("--bench-concurrency", type=int, default=50, help="requests in flight at once")
+    group.addoption("--bench-seed", type=int, default=10_000, help="extra users seeded for listing benchmarks")
+    group.addoption("--bench-search-seed", type=int, default=1_000_000, help="users seeded for the search benchmark")
+    group.addoption("--bench-search-limit", type=float, default=10, help="p95 search latency budget in ms")
+    group.addoption("--bench-output", default="bench_output.json", help="where to write benchmark results")
+    group.addoption("--bench-baseline", default=None, help="results file to compare against")
+    group.addoption("--bench-tolerance", type=float, default=0.2, help="allowed regression against the baseline")
+    group = parser.getgroup("database")
+    group.addoption("--db-template", default=None, help="seeded database built by tests.seed to clone instead of an empty schema")
+
+
+def pytest_collection_modifyitems(items):
+    # with --dist loadgroup the chain stays on one worker in file order, isolated tests can run
+    # anywhere, the rest of a module stays together on one worker since it shares module fixtures
+    for item in items:
+        if CHAIN_FILE.match(item.path.name):
+            group = "chain"
+        elif "isolated" in item.fixturenames:
+            continue
+        else:
+            group = item.module.__name__
+        item.add_marker(pytest.mark.xdist_group(group))
+
+
+def worker_db_url(url: str, template: str = None) -> str:
+    # workers and template clones get a database of their own next to db_url_test,
+    # which is only ever connected to and never dropped
+    suffixes = [name for name in (template, worker_id) if name is not None]
+    if not suffixes:
+        return url
+    worker_url = make_url(url)
+    return worker_url.set(database="_".join([worker_url.database, *suffixes])).render_as_string(hide_password=False)
+
+
+test_db_url = worker_db_url(system_config.db_url_test)
+
+test_db: Database = Database(test_db_url, force_rollback=True)
 
 
 def override_get_db() -> Database:
@@ -27,7 +81,51 @@ def override_get_db() -> Database:
 
 app.dependency_overrides[get_db] = override_get_db
 
-engine_test = create_async_engine(system_config.db_url_test, poolclass=NullPool)
+engine_test = create_async_engine(test_db_url, poolclass=NullPool)
+
+
+def pytest_configure(config):
+    # options are only known here, fixtures and override_get_db read these globals at call time
+    global test_db_url, test_db, engine_test
+    template = config.getoption("db_template", None)
+    if template is not None:
+        test_db_url = worker_db_url(system_config.db_url_test, template)
+        test_db = Database(test_db_url, force_rollback=True)
+        engine_test = create_async_engine(test_db_url, poolclass=NullPool)
+
+
+@asynccontextmanager
+async def committed_database(url: str):
+    # a real pool without force_rollback for tests about concurrent transactions, rows it
+    # commits are visible to every connection, so all of them are deleted on the way out
+    pool_db = make_db(url)
+    await pool_db.connect()
+    app.dependency_overrides[get_db] = lambda: pool_db
+    try:
+        yield pool_db
+    finally:
+        app.dependency_overrides[get_db] = override_get_db
+        for table in reversed(Base.metadata.sorted_tables):
+            await pool_db.execute(table.delete())
+        await pool_db.disconnect()
+
+
+class CountingDatabase:
+    # passes queries through to the test database and counts them
+    def __init__(self, db):
+        self.db = db
+        self.queries = 0
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.db, name)
+        if name not in ("execute", "execute_many", "fetch_one", "fetch_all", "fetch_val", "iterate"):
+            return attribute
+
+        def counted(*args, **kwargs):
+            self.queries += 1
+            return attribute(*args, **kwargs)
+
+        return counted
 
 
 @pytest.fixture(scope="session")
@@ -44,14 +142,39 @@ def test_app():
 
 
 @pytest.fixture(autouse=True, scope='session')
-async def prepare_database():
+async def prepare_database(pytestconfig):
+    template = pytestconfig.getoption("db_template")
+    own_database = test_db_url != system_config.db_url_test
+    if own_database:
+        await seed.create_database(make_url(test_db_url).database, template)
     await test_db.connect()
-    async with engine_test.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    if template is None:
+        async with engine_test.begin() as conn:
+            await seed.create_schema(conn)
     yield
     await test_db.disconnect()
     async with engine_test.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    await engine_test.dispose()
+    if own_database:
+        await seed.drop_database(make_url(test_db_url).database)
+
+
+@pytest.fixture(autouse=True, scope='module')
+async def module_savepoint(request):
+    # independent modules roll back whatever they created so the chain sees only its own rows.
+    # Benchmarks keep package-scoped data on their own pool, a module savepoint would drop it early
+    if CHAIN_FILE.match(request.path.name) or request.node.get_closest_marker("benchmark"):
+        yield
+        return
+    async with test_db.transaction(force_rollback=True):
+        yield
+
+
+@pytest.fixture
+async def isolated():
+    async with test_db.transaction(force_rollback=True):
+        yield test_db
 
 
 @pytest.fixture(scope="session")
@@ -77,7 +200,136 @@ async def login_user(ac: AsyncClient, users_tokens):
     return __send_request
 
 
+@pytest.fixture(scope='session')
+async def create_user(ac: AsyncClient, users_ids):
+    async def __send_request(user_email: str, user_password: str, user_name: str):
+        payload = {
+            "user_password": user_password,
+            "user_password_repeat": user_password,
+            "user_email": user_email,
+            "user_name": user_name,
+        }
+        response = await ac.post("/user/", json=payload)
+        if response.status_code != 200:
+            return response
+        users_ids[user_email] = response.json().get('result').get('user_id')
+        return response
+
+    return __send_request
+
+
 @pytest.fixture(scope='session')
 def users_tokens():
     tokens_store = dict()
     return tokens_store
+
+
+@pytest.fixture(scope='session')
+def users_ids():
+    ids_store = dict()
+    return ids_store
+
+
+@pytest.fixture(scope='session')
+def companies_ids():
+    ids_store = dict()
+    return ids_store
+
+
+@pytest.fixture(scope='session')
+def invites_ids():
+    ids_store = dict()
+    return ids_store
+
+
+@pytest.fixture(scope='session')
+def requests_ids():
+    ids_store = dict()
+    return ids_store
+
+
+@pytest.fixture(scope='session')
+def unique_name():
+    numbers = count(1)
+
+    def __next(prefix: str) -> str:
+        return f"{prefix}{next(numbers)}"
+
+    return __next
+
+
+@pytest.fixture(scope='session')
+async def user_factory(create_user, login_user, users_tokens, users_ids, unique_name):
+    async def __create(prefix: str = "user") -> dict:
+        user_name = unique_name(f"factory_{prefix}")
+        user_email = f"{user_name}@test.com"
+        response = await create_user(user_email, user_name, user_name)
+        assert response.status_code == 200
+        response = await login_user(user_email, user_name)
+        assert response.status_code == 200
+        return {
+            "user_id": users_ids[user_email],
+            "user_email": user_email,
+            "user_name": user_name,
+            "headers": {"Authorization": f"Bearer {users_tokens[user_email]}"},
+        }
+
+    return __create
+
+
+@pytest.fixture(scope='session')
+async def company_factory(ac: AsyncClient, unique_name):
+    async def __create(owner: dict, prefix: str = "company") -> int:
+        payload = {
+            "company_name": unique_name(f"factory_{prefix}"),
+        }
+        response = await ac.post("/company/", json=payload, headers=owner["headers"])
+        assert response.status_code == 201
+        return response.json().get("result").get("company_id")
+
+    return __create
+
+
+@pytest.fixture(scope='session')
+def db() -> Database:
+    return test_db
+
+
+@pytest.fixture(scope='session')
+def db_url() -> str:
+    return test_db_url
+
+
+@pytest.fixture(scope='module')
+async def pooled_db():
+    async with committed_database(test_db_url) as pool_db:
+        yield pool_db
+
+
+@pytest.fixture
+def counting_db(monkeypatch) -> CountingDatabase:
+    # the app gets the same rollback session, every query it sends through get_db is counted
+    counter = CountingDatabase(test_db)
+    monkeypatch.setitem(app.dependency_overrides, get_db, lambda: counter)
+    return counter
+
+
+@pytest.fixture(scope='session')
+def raw_connection():
+    # the asyncpg connection behind test_db, for COPY inside the rolled back session
+    return test_db.connection().raw_connection
+
+
+@pytest.fixture(scope='session')
+def db_template(pytestconfig):
+    return pytestconfig.getoption("db_template")
+
+
+@pytest.fixture(scope='session')
+def users_table() -> Table:
+    return seed.find_table("user_email")
+
+
+@pytest.fixture(scope='session')
+def companies_table() -> Table:
+    return seed.find_table("company_name")
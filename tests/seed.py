@@ -0,0 +1,139 @@
+"""
+Seed large datasets without going through the API.
+
+Rows are written with COPY, either into the running test database
+(copy_users / copy_companies on a raw asyncpg connection) or into a
+template database built once and cloned per worker:
+
+    python -m tests.seed --template intern_template --users 1000000 --companies 10000
+    python -m pytest --db-template intern_template -m benchmark tests/benchmarks
+"""
+import argparse
+import asyncio
+import time
+
+from typing import Optional
+
+import asyncpg
+from sqlalchemy import Table, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from core.config import system_config
+from db.models import Base
+
+
+USER_COLUMNS = ("user_email", "user_name", "user_password")
+COMPANY_COLUMNS = ("company_name", "company_description", "company_owner_id")
+SEED_PASSWORD = "seed_password_hash"
+TEMPLATE_PREFIX = "template"
+
+
+def database_url(url: str, database: str) -> str:
+    return make_url(url).set(database=database).render_as_string(hide_password=False)
+
+
+def asyncpg_dsn(url: str) -> str:
+    return make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+def find_table(column_name: str) -> Table:
+    # tables are declared by the backend, so look them up by a column we know from the API
+    for table in Base.metadata.sorted_tables:
+        if column_name in table.columns:
+            return table
+    raise LookupError(f"No table with column {column_name}")
+
+
+async def copy_users(connection: asyncpg.Connection, prefix: str, count: int, start: int = 0) -> None:
+    records = (
+        (f"{prefix}_{i}@seed.com", f"{prefix}_{i}", SEED_PASSWORD)
+        for i in range(start, start + count)
+    )
+    await connection.copy_records_to_table(find_table("user_email").name, records=records, columns=USER_COLUMNS)
+
+
+async def copy_companies(connection: asyncpg.Connection, prefix: str, count: int, owner_id: int) -> None:
+    records = (
+        (f"{prefix}_company_{i}", f"{prefix}_company_description_{i}", owner_id)
+        for i in range(count)
+    )
+    await connection.copy_records_to_table(find_table("company_name").name, records=records, columns=COMPANY_COLUMNS)
+
+
+async def count_users(connection: asyncpg.Connection, prefix: str) -> int:
+    users_table = find_table("user_email")
+    return await connection.fetchval(
+        f'SELECT count(*) FROM "{users_table.name}" WHERE user_email LIKE $1', f"{prefix}\\_%"
+    )
+
+
+async def create_schema(conn) -> None:
+    # trigram indexes on the search columns need the extension before create_all
+    await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    await conn.run_sync(Base.metadata.create_all)
+
+
+async def admin_execute(*statements: str) -> None:
+    # CREATE/DROP DATABASE can't run inside a transaction or while connected to the target,
+    # db_url_test itself is never a target, so it doubles as the maintenance connection
+    admin_engine = create_async_engine(
+        system_config.db_url_test,
+        poolclass=NullPool,
+        isolation_level="AUTOCOMMIT",
+    )
+    async with admin_engine.connect() as conn:
+        for statement in statements:
+            await conn.execute(text(statement))
+    await admin_engine.dispose()
+
+
+async def create_database(database: str, template: Optional[str] = None) -> None:
+    # cloning a template copies files instead of replaying inserts, it needs no open connections to it
+    create = f'CREATE DATABASE "{database}"'
+    if template is not None:
+        create += f' TEMPLATE "{template}"'
+    await admin_execute(f'DROP DATABASE IF EXISTS "{database}"', create)
+
+
+async def drop_database(database: str) -> None:
+    await admin_execute(f'DROP DATABASE IF EXISTS "{database}"')
+
+
+async def build_template(template: str, users: int, companies: int) -> None:
+    await create_database(template)
+    template_url = database_url(system_config.db_url_test, template)
+
+    engine = create_async_engine(template_url, poolclass=NullPool)
+    async with engine.begin() as conn:
+        await create_schema(conn)
+    await engine.dispose()
+
+    connection = await asyncpg.connect(asyncpg_dsn(template_url))
+    try:
+        await copy_users(connection, TEMPLATE_PREFIX, users)
+        if companies:
+            users_table = find_table("user_email")
+            owner_id = await connection.fetchval(f'SELECT min("{users_table.primary_key.columns[0].name}") FROM "{users_table.name}"')
+            await copy_companies(connection, TEMPLATE_PREFIX, companies, owner_id)
+        await connection.execute("ANALYZE")
+    finally:
+        await connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a seeded template database for tests and benchmarks")
+    parser.add_argument("--template", required=True, help="name of the template database")
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--companies", type=int, default=10_000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    asyncio.run(build_template(args.template, args.users, args.companies))
+    print(f"built {args.template} with {args.users} users and {args.companies} companies "
+          f"in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
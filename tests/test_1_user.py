@@ -45,7 +45,7 @@ async def test_bad_create_user__no_valid_email(ac: AsyncClient):
     assert response.status_code == 422
 
 
-async def test_create_user_one(ac: AsyncClient):
+async def test_create_user_one(ac: AsyncClient, users_ids):
     payload = {
         "user_password": "test1",
         "user_password_repeat": "test1",
@@ -54,7 +54,7 @@ async def test_create_user_one(ac: AsyncClient):
     }
     response = await ac.post("/user/", json=payload)
     assert response.status_code == 200
-    assert response.json().get("result").get("user_id") == 1
+    users_ids["test1@test.com"] = response.json().get("result").get("user_id")
 
 
 async def test_bad_create_user__email_exist(ac: AsyncClient):
@@ -68,7 +68,7 @@ async def test_bad_create_user__email_exist(ac: AsyncClient):
     assert response.status_code == 400
 
 
-async def test_create_user_two(ac: AsyncClient):
+async def test_create_user_two(ac: AsyncClient, users_ids):
     payload = {
         "user_password": "test2",
         "user_password_repeat": "test2",
@@ -77,10 +77,12 @@ async def test_create_user_two(ac: AsyncClient):
     }
     response = await ac.post("/user/", json=payload)
     assert response.status_code == 200
-    assert response.json().get("result").get("user_id") == 2
+    user_id = response.json().get("result").get("user_id")
+    assert user_id > users_ids["test1@test.com"]
+    users_ids["test2@test.com"] = user_id
 
 
-async def test_create_user_three(ac: AsyncClient):
+async def test_create_user_three(ac: AsyncClient, users_ids):
     payload = {
         "user_password": "test3",
         "user_password_repeat": "test3",
@@ -89,10 +91,12 @@ async def test_create_user_three(ac: AsyncClient):
     }
     response = await ac.post("/user/", json=payload)
     assert response.status_code == 200
-    assert response.json().get("result").get("user_id") == 3
+    user_id = response.json().get("result").get("user_id")
+    assert user_id > users_ids["test2@test.com"]
+    users_ids["test3@test.com"] = user_id
 
 
-async def test_create_user_four(ac: AsyncClient):
+async def test_create_user_four(ac: AsyncClient, users_ids):
     payload = {
         "user_password": "test4",
         "user_password_repeat": "test4",
@@ -101,10 +105,12 @@ async def test_create_user_four(ac: AsyncClient):
     }
     response = await ac.post("/user/", json=payload)
     assert response.status_code == 200
-    assert response.json().get("result").get("user_id") == 4
+    user_id = response.json().get("result").get("user_id")
+    assert user_id > users_ids["test3@test.com"]
+    users_ids["test4@test.com"] = user_id
 
 
-async def test_create_user_five(ac: AsyncClient):
+async def test_create_user_five(ac: AsyncClient, users_ids):
     payload = {
         "user_password": "test5",
         "user_password_repeat": "test5",
@@ -113,7 +119,9 @@ async def test_create_user_five(ac: AsyncClient):
     }
     response = await ac.post("/user/", json=payload)
     assert response.status_code == 200
-    assert response.json().get("result").get("user_id") == 5
+    user_id = response.json().get("result").get("user_id")
+    assert user_id > users_ids["test4@test.com"]
+    users_ids["test5@test.com"] = user_id
 
 
 # =================================
@@ -155,7 +163,7 @@ async def test_try_login_five(ac: AsyncClient, login_user):
     assert response.json().get('result').get('token_type') == 'Bearer'
 
 
-async def test_auth_me_one(ac: AsyncClient, users_tokens):
+async def test_auth_me_one(ac: AsyncClient, users_tokens, users_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
@@ -163,11 +171,11 @@ async def test_auth_me_one(ac: AsyncClient, users_tokens):
     assert response.status_code == 200
     assert response.json().get('result').get('user_name') == "test1"
     assert response.json().get('result').get('user_email') == "test1@test.com"
-    assert response.json().get('result').get('user_id') == 1
+    assert response.json().get('result').get('user_id') == users_ids["test1@test.com"]
     assert response.json().get('result').get('user_password') == None
 
 
-async def test_auth_me_two(ac: AsyncClient, users_tokens):
+async def test_auth_me_two(ac: AsyncClient, users_tokens, users_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
@@ -175,7 +183,7 @@ async def test_auth_me_two(ac: AsyncClient, users_tokens):
     assert response.status_code == 200
     assert response.json().get('result').get('user_name') == "test2"
     assert response.json().get('result').get('user_email') == "test2@test.com"
-    assert response.json().get('result').get('user_id') == 2
+    assert response.json().get('result').get('user_id') == users_ids["test2@test.com"]
     assert response.json().get('result').get('user_password') == None
 
 
@@ -204,20 +212,20 @@ async def test_get_users_list_unauth(ac: AsyncClient):
     assert response.status_code == 403
 
 
-async def test_get_user_by_id(ac: AsyncClient, users_tokens):
+async def test_get_user_by_id(ac: AsyncClient, users_tokens, users_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.get("/user/2/", headers=headers)
+    response = await ac.get(f"/user/{users_ids['test2@test.com']}/", headers=headers)
     assert response.status_code == 200
     assert response.json().get('result').get('user_name') == "test2"
     assert response.json().get('result').get('user_email') == "test2@test.com"
-    assert response.json().get('result').get('user_id') == 2
+    assert response.json().get('result').get('user_id') == users_ids["test2@test.com"]
     assert response.json().get('result').get('user_password') == None
 
 
-async def test_get_user_by_id_unauth(ac: AsyncClient):
-    response = await ac.get("/user/2/")
+async def test_get_user_by_id_unauth(ac: AsyncClient, users_ids):
+    response = await ac.get(f"/user/{users_ids['test2@test.com']}/")
     assert response.status_code == 403
 
 
@@ -225,60 +233,60 @@ async def test_bad_get_user_by_id__not_found(ac: AsyncClient, users_tokens):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.get("/user/6/", headers=headers)
+    response = await ac.get("/user/1000000/", headers=headers)
     assert response.status_code == 404
 
 
-async def test_bad_update_user_one__not_your_acc(ac: AsyncClient, users_tokens):
+async def test_bad_update_user_one__not_your_acc(ac: AsyncClient, users_tokens, users_ids):
     payload = {
         "user_name": "test1NEW",
     }
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.put("/user/2/", json=payload, headers=headers)
+    response = await ac.put(f"/user/{users_ids['test2@test.com']}/", json=payload, headers=headers)
     assert response.status_code == 403
     assert response.json().get("detail") == "It's not your account"
 
 
-async def test_update_user_one(ac: AsyncClient, users_tokens):
+async def test_update_user_one(ac: AsyncClient, users_tokens, users_ids):
     payload = {
         "user_name": "test1NEW",
     }
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.put("/user/1/", json=payload, headers=headers)
+    response = await ac.put(f"/user/{users_ids['test1@test.com']}/", json=payload, headers=headers)
     assert response.status_code == 200
-    assert response.json().get("result").get("user_id") == 1
+    assert response.json().get("result").get("user_id") == users_ids["test1@test.com"]
 
 
-async def test_get_user_by_id_updated(ac: AsyncClient, users_tokens):
+async def test_get_user_by_id_updated(ac: AsyncClient, users_tokens, users_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.get("/user/1/", headers=headers)
+    response = await ac.get(f"/user/{users_ids['test1@test.com']}/", headers=headers)
     assert response.status_code == 200
-    assert response.json().get("result").get("user_id") == 1
+    assert response.json().get("result").get("user_id") == users_ids["test1@test.com"]
     assert response.json().get("result").get("user_email") == 'test1@test.com'
     assert response.json().get("result").get("user_name") == 'test1NEW'
     assert response.json().get('result').get('user_password') == None
 
 
-async def test_bad_delete_user_five__not_your_acc(ac: AsyncClient, users_tokens):
+async def test_bad_delete_user_five__not_your_acc(ac: AsyncClient, users_tokens, users_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.delete("/user/5/", headers=headers)
+    response = await ac.delete(f"/user/{users_ids['test5@test.com']}/", headers=headers)
     assert response.status_code == 403
     assert response.json().get("detail") == "It's not your account"
 
 
-async def test_delete_user_five(ac: AsyncClient, users_tokens):
+async def test_delete_user_five(ac: AsyncClient, users_tokens, users_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test5@test.com']}",
     }
-    response = await ac.delete("/user/5/", headers=headers)
+    response = await ac.delete(f"/user/{users_ids['test5@test.com']}/", headers=headers)
     assert response.status_code == 200
 
 
@@ -22,7 +22,7 @@ async def test_bad_create_company__no_name(ac: AsyncClient, users_tokens):
     assert response.status_code == 422
 
 
-async def test_create_company_one(users_tokens, ac: AsyncClient):
+async def test_create_company_one(users_tokens, ac: AsyncClient, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
@@ -32,10 +32,10 @@ async def test_create_company_one(users_tokens, ac: AsyncClient):
     }
     response = await ac.post("/company/", json=payload, headers=headers)
     assert response.status_code == 201
-    assert response.json().get("result").get("company_id") == 1
+    companies_ids["test_company_1"] = response.json().get("result").get("company_id")
 
 
-async def test_create_company_two(users_tokens, ac: AsyncClient):
+async def test_create_company_two(users_tokens, ac: AsyncClient, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
@@ -44,10 +44,10 @@ async def test_create_company_two(users_tokens, ac: AsyncClient):
     }
     response = await ac.post("/company/", json=payload, headers=headers)
     assert response.status_code == 201
-    assert response.json().get("result").get("company_id") == 2
+    companies_ids["test_company_2"] = response.json().get("result").get("company_id")
 
 
-async def test_create_company_three(users_tokens, ac: AsyncClient):
+async def test_create_company_three(users_tokens, ac: AsyncClient, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test3@test.com']}",
     }
@@ -56,7 +56,7 @@ async def test_create_company_three(users_tokens, ac: AsyncClient):
     }
     response = await ac.post("/company/", json=payload, headers=headers)
     assert response.status_code == 201
-    assert response.json().get("result").get("company_id") == 3
+    companies_ids["test_company_3"] = response.json().get("result").get("company_id")
 
 
 async def test_get_all_companies(users_tokens, ac: AsyncClient):
@@ -72,40 +72,40 @@ async def test_bad_get_company_by_id_not_found(users_tokens, ac: AsyncClient):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.get("/company/4/", headers=headers)
+    response = await ac.get("/company/1000000/", headers=headers)
     assert response.status_code == 404
 
 
-async def test_get_company_by_id_one(users_tokens, ac: AsyncClient):
+async def test_get_company_by_id_one(users_tokens, ac: AsyncClient, users_ids, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test3@test.com']}",
     }
-    response = await ac.get("/company/1/", headers=headers)
+    response = await ac.get(f"/company/{companies_ids['test_company_1']}/", headers=headers)
     assert response.status_code == 200
-    assert response.json().get("result").get("company_id") == 1
+    assert response.json().get("result").get("company_id") == companies_ids["test_company_1"]
     assert response.json().get("result").get("company_name") == "test_company_1"
     assert response.json().get("result").get("company_description") == "company_description_1"
-    assert response.json().get("result").get("company_owner_id") == 1
+    assert response.json().get("result").get("company_owner_id") == users_ids["test1@test.com"]
 
 
-async def test_get_company_by_id_tw(users_tokens, ac: AsyncClient):
+async def test_get_company_by_id_tw(users_tokens, ac: AsyncClient, users_ids, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.get("/company/2/", headers=headers)
+    response = await ac.get(f"/company/{companies_ids['test_company_2']}/", headers=headers)
     assert response.status_code == 200
-    assert response.json().get("result").get("company_id") == 2
+    assert response.json().get("result").get("company_id") == companies_ids["test_company_2"]
     assert response.json().get("result").get("company_name") == "test_company_2"
     assert response.json().get("result").get("company_description") == None
-    assert response.json().get("result").get("company_owner_id") == 2
+    assert response.json().get("result").get("company_owner_id") == users_ids["test2@test.com"]
 
 
-async def test_bad_update_company__unauthorized(ac: AsyncClient):
+async def test_bad_update_company__unauthorized(ac: AsyncClient, companies_ids):
     payload = {
         "company_name": "company_name_1_NEW",
         "company_description": "company_description_1_NEW"
     }
-    response = await ac.put("/company/1/", json=payload)
+    response = await ac.put(f"/company/{companies_ids['test_company_1']}/", json=payload)
     assert response.status_code == 403
 
 
@@ -117,11 +117,11 @@ async def test_bad_update_company__not_found(users_tokens, ac: AsyncClient):
         "company_name": "company_name_1_NEW",
         "company_description": "company_description_1_NEW"
     }
-    response = await ac.put("/company/100/", json=payload, headers=headers)
+    response = await ac.put("/company/1000000/", json=payload, headers=headers)
     assert response.status_code == 404
 
 
-async def test_bad_update_company__not_your_company(users_tokens, ac: AsyncClient):
+async def test_bad_update_company__not_your_company(users_tokens, ac: AsyncClient, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
@@ -129,11 +129,11 @@ async def test_bad_update_company__not_your_company(users_tokens, ac: AsyncClien
         "company_name": "company_name_2_NEW",
         "company_description": "company_description_2_NEW"
     }
-    response = await ac.put("/company/2/", json=payload, headers=headers)
+    response = await ac.put(f"/company/{companies_ids['test_company_2']}/", json=payload, headers=headers)
     assert response.status_code == 403
 
 
-async def test_update_company(users_tokens, ac: AsyncClient):
+async def test_update_company(users_tokens, ac: AsyncClient, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
@@ -141,35 +141,35 @@ async def test_update_company(users_tokens, ac: AsyncClient):
         "company_name": "company_name_1_NEW",
         "company_description": "company_description_1_NEW"
     }
-    response = await ac.put("/company/1/", json=payload, headers=headers)
+    response = await ac.put(f"/company/{companies_ids['test_company_1']}/", json=payload, headers=headers)
     assert response.status_code == 200
 
 
-async def test_get_company_by_id_one_updated(users_tokens, ac: AsyncClient):
+async def test_get_company_by_id_one_updated(users_tokens, ac: AsyncClient, users_ids, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.get("/company/1/", headers=headers)
+    response = await ac.get(f"/company/{companies_ids['test_company_1']}/", headers=headers)
     assert response.status_code == 200
-    assert response.json().get("result").get("company_id") == 1
+    assert response.json().get("result").get("company_id") == companies_ids["test_company_1"]
     assert response.json().get("result").get("company_name") == "company_name_1_NEW"
     assert response.json().get("result").get("company_description") == "company_description_1_NEW"
-    assert response.json().get("result").get("company_owner_id") == 1
+    assert response.json().get("result").get("company_owner_id") == users_ids["test1@test.com"]
 
 
-async def test_bad_delete_company_one__user_not_owner(users_tokens, ac: AsyncClient):
+async def test_bad_delete_company_one__user_not_owner(users_tokens, ac: AsyncClient, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.delete("/company/1/", headers=headers)
+    response = await ac.delete(f"/company/{companies_ids['test_company_1']}/", headers=headers)
     assert response.status_code == 403
 
 
-async def test_delete_company_three(users_tokens, ac: AsyncClient):
+async def test_delete_company_three(users_tokens, ac: AsyncClient, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test3@test.com']}",
     }
-    response = await ac.delete("/company/3/", headers=headers)
+    response = await ac.delete(f"/company/{companies_ids['test_company_3']}/", headers=headers)
     assert response.status_code == 200
 
 
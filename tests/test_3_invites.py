@@ -1,12 +1,22 @@
 from httpx import AsyncClient
 
 
+async def find_invite_id(ac: AsyncClient, user_token: str, company_id: int) -> int:
+    headers = {
+        "Authorization": f"Bearer {user_token}",
+    }
+    response = await ac.get("/invite/my", headers=headers)
+    for invite in response.json().get('result'):
+        if invite.get('from_company_id') == company_id:
+            return invite.get('invite_id')
+
+
 # send invite tests
 
-async def test_send_invite_not_auth(ac: AsyncClient):
+async def test_send_invite_not_auth(ac: AsyncClient, users_ids, companies_ids):
     payload = {
-        "to_user_id": 1,
-        "from_company_id": 1,
+        "to_user_id": users_ids["test1@test.com"],
+        "from_company_id": companies_ids["test_company_1"],
         "invite_message": "string"
     }
     response = await ac.post("/invite/", json=payload)
@@ -14,13 +24,13 @@ async def test_send_invite_not_auth(ac: AsyncClient):
     assert response.json().get('detail') == "Not authenticated"
 
 
-async def test_send_invite_not_found_user(ac: AsyncClient, users_tokens):
+async def test_send_invite_not_found_user(ac: AsyncClient, users_tokens, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
     payload = {
-        "to_user_id": 100,
-        "from_company_id": 1,
+        "to_user_id": 1000000,
+        "from_company_id": companies_ids["test_company_1"],
         "invite_message": "string"
     }
     response = await ac.post("/invite/", json=payload, headers=headers)
@@ -28,13 +38,13 @@ async def test_send_invite_not_found_user(ac: AsyncClient, users_tokens):
     assert response.json().get('detail') == 'This user not found'
 
 
-async def test_send_invite_not_found_company(ac: AsyncClient, users_tokens):
+async def test_send_invite_not_found_company(ac: AsyncClient, users_tokens, users_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
     payload = {
-        "to_user_id": 1,
-        "from_company_id": 100,
+        "to_user_id": users_ids["test1@test.com"],
+        "from_company_id": 1000000,
         "invite_message": "string"
     }
     response = await ac.post("/invite/", json=payload, headers=headers)
@@ -42,13 +52,13 @@ async def test_send_invite_not_found_company(ac: AsyncClient, users_tokens):
     assert response.json().get('detail') == 'This company not found'
 
 
-async def test_send_invite_not_your_company(ac: AsyncClient, users_tokens):
+async def test_send_invite_not_your_company(ac: AsyncClient, users_tokens, users_ids, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
     payload = {
-        "to_user_id": 1,
-        "from_company_id": 1,
+        "to_user_id": users_ids["test1@test.com"],
+        "from_company_id": companies_ids["test_company_1"],
         "invite_message": "string"
     }
     response = await ac.post("/invite/", json=payload, headers=headers)
@@ -56,60 +66,64 @@ async def test_send_invite_not_your_company(ac: AsyncClient, users_tokens):
     assert response.json().get('detail') == "it's not your company"
 
 
-async def test_send_invite_one_success(ac: AsyncClient, users_tokens):
+async def test_send_invite_one_success(ac: AsyncClient, users_tokens, users_ids, companies_ids, invites_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
     payload = {
-        "to_user_id": 2,
-        "from_company_id": 1,
+        "to_user_id": users_ids["test2@test.com"],
+        "from_company_id": companies_ids["test_company_1"],
         "invite_message": "string"
     }
     response = await ac.post("/invite/", json=payload, headers=headers)
     assert response.status_code == 200
     assert response.json().get('detail') == "success"
+    invites_ids[1] = await find_invite_id(ac, users_tokens['test2@test.com'], companies_ids['test_company_1'])
 
 
-async def test_send_invite_two_success(ac: AsyncClient, users_tokens):
+async def test_send_invite_two_success(ac: AsyncClient, users_tokens, users_ids, companies_ids, invites_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
     payload = {
-        "to_user_id": 1,
-        "from_company_id": 2,
+        "to_user_id": users_ids["test1@test.com"],
+        "from_company_id": companies_ids["test_company_2"],
         "invite_message": "string"
     }
     response = await ac.post("/invite/", json=payload, headers=headers)
     assert response.status_code == 200
     assert response.json().get('detail') == "success"
+    invites_ids[2] = await find_invite_id(ac, users_tokens['test1@test.com'], companies_ids['test_company_2'])
 
 
-async def test_send_invite_three_success(ac: AsyncClient, users_tokens):
+async def test_send_invite_three_success(ac: AsyncClient, users_tokens, users_ids, companies_ids, invites_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
     payload = {
-        "to_user_id": 3,
-        "from_company_id": 1,
+        "to_user_id": users_ids["test3@test.com"],
+        "from_company_id": companies_ids["test_company_1"],
         "invite_message": "string"
     }
     response = await ac.post("/invite/", json=payload, headers=headers)
     assert response.status_code == 200
     assert response.json().get('detail') == "success"
+    invites_ids[3] = await find_invite_id(ac, users_tokens['test3@test.com'], companies_ids['test_company_1'])
 
 
-async def test_send_invite_four_success(ac: AsyncClient, users_tokens):
+async def test_send_invite_four_success(ac: AsyncClient, users_tokens, users_ids, companies_ids, invites_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
     payload = {
-        "to_user_id": 3,
-        "from_company_id": 2,
+        "to_user_id": users_ids["test3@test.com"],
+        "from_company_id": companies_ids["test_company_2"],
         "invite_message": "string"
     }
     response = await ac.post("/invite/", json=payload, headers=headers)
     assert response.status_code == 200
     assert response.json().get('detail') == "success"
+    invites_ids[4] = await find_invite_id(ac, users_tokens['test3@test.com'], companies_ids['test_company_2'])
 
 
 # My invites
@@ -148,42 +162,42 @@ async def test_my_invites_user_three(ac: AsyncClient, users_tokens):
 
 # Company invites
 
-async def test_company_invites_not_auth(ac: AsyncClient):
-    response = await ac.get("/invite/company/1/")
+async def test_company_invites_not_auth(ac: AsyncClient, companies_ids):
+    response = await ac.get(f"/invite/company/{companies_ids['test_company_1']}/")
     assert response.status_code == 403
 
 
-async def test_invites_company_one_not_owner(ac: AsyncClient, users_tokens):
+async def test_invites_company_one_not_owner(ac: AsyncClient, users_tokens, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.get("/invite/company/1/", headers=headers)
+    response = await ac.get(f"/invite/company/{companies_ids['test_company_1']}/", headers=headers)
     assert response.status_code == 403
     assert response.json().get('detail') == "it's not your company"
 
 
-async def test_invites_company_one(ac: AsyncClient, users_tokens):
+async def test_invites_company_one(ac: AsyncClient, users_tokens, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.get("/invite/company/1/", headers=headers)
+    response = await ac.get(f"/invite/company/{companies_ids['test_company_1']}/", headers=headers)
     assert response.status_code == 200
     assert len(response.json().get('result')) == 2
 
 
-async def test_invites_company_two(ac: AsyncClient, users_tokens):
+async def test_invites_company_two(ac: AsyncClient, users_tokens, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.get("/invite/company/2/", headers=headers)
+    response = await ac.get(f"/invite/company/{companies_ids['test_company_2']}/", headers=headers)
     assert response.status_code == 200
     assert len(response.json().get('result')) == 2
 
 
 # cancel-invite
 
-async def test_cancel_invite_not_auth(ac: AsyncClient):
-    response = await ac.delete("/invite/1/")
+async def test_cancel_invite_not_auth(ac: AsyncClient, invites_ids):
+    response = await ac.delete(f"/invite/{invites_ids[1]}/")
     assert response.status_code == 403
     assert response.json().get('detail') == "Not authenticated"
 
@@ -192,33 +206,33 @@ async def test_cancel_invite_not_found(ac: AsyncClient, users_tokens):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.delete("/invite/100/", headers=headers)
+    response = await ac.delete("/invite/1000000/", headers=headers)
     assert response.status_code == 404
     assert response.json().get('detail') == "Invite not found"
 
 
-async def test_cancel_invite_not_your(ac: AsyncClient, users_tokens):
+async def test_cancel_invite_not_your(ac: AsyncClient, users_tokens, invites_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.delete("/invite/1/", headers=headers)
+    response = await ac.delete(f"/invite/{invites_ids[1]}/", headers=headers)
     assert response.status_code == 403
     assert response.json().get('detail') == "it's not your company"
 
 
-async def test_cancel_invite_success(ac: AsyncClient, users_tokens):
+async def test_cancel_invite_success(ac: AsyncClient, users_tokens, invites_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.delete("/invite/1/", headers=headers)
+    response = await ac.delete(f"/invite/{invites_ids[1]}/", headers=headers)
     assert response.status_code == 200
     assert response.json().get('detail') == "success"
 
 
 # Accept invite
 
-async def test_accept_invite_not_auth(ac: AsyncClient):
-    response = await ac.get("/invite/1/accept/")
+async def test_accept_invite_not_auth(ac: AsyncClient, invites_ids):
+    response = await ac.get(f"/invite/{invites_ids[1]}/accept/")
     assert response.status_code == 403
     assert response.json().get('detail') == "Not authenticated"
 
@@ -227,33 +241,33 @@ async def test_accept_invite_not_found(ac: AsyncClient, users_tokens):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.get("/invite/100/accept/", headers=headers)
+    response = await ac.get("/invite/1000000/accept/", headers=headers)
     assert response.status_code == 404
     assert response.json().get('detail') == "Invite not found"
 
 
-async def test_accept_invite_not_your(ac: AsyncClient, users_tokens):
+async def test_accept_invite_not_your(ac: AsyncClient, users_tokens, invites_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.get("/invite/2/accept/", headers=headers)
+    response = await ac.get(f"/invite/{invites_ids[2]}/accept/", headers=headers)
     assert response.status_code == 400
     assert response.json().get('detail') == "It is not your invite"
 
 
-async def test_accept_invite_two_success(ac: AsyncClient, users_tokens):
+async def test_accept_invite_two_success(ac: AsyncClient, users_tokens, invites_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.get("/invite/2/accept/", headers=headers)
+    response = await ac.get(f"/invite/{invites_ids[2]}/accept/", headers=headers)
     assert response.status_code == 200
     assert response.json().get('detail') == "success"
 
 
 # decline-invite
 
-async def test_decli_invite_not_auth(ac: AsyncClient):
-    response = await ac.get("/invite/1/decline/")
+async def test_decli_invite_not_auth(ac: AsyncClient, invites_ids):
+    response = await ac.get(f"/invite/{invites_ids[1]}/decline/")
     assert response.status_code == 403
     assert response.json().get('detail') == "Not authenticated"
 
@@ -262,50 +276,50 @@ async def test_decli_invite_not_found(ac: AsyncClient, users_tokens):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.get("/invite/100/decline/", headers=headers)
+    response = await ac.get("/invite/1000000/decline/", headers=headers)
     assert response.status_code == 404
     assert response.json().get('detail') == "Invite not found"
 
 
-async def test_decli_invite_not_your(ac: AsyncClient, users_tokens):
+async def test_decli_invite_not_your(ac: AsyncClient, users_tokens, invites_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.get("/invite/3/decline/", headers=headers)
+    response = await ac.get(f"/invite/{invites_ids[3]}/decline/", headers=headers)
     assert response.status_code == 400
     assert response.json().get('detail') == "User does not have an invite to the company"
 
 
-async def test_decli_invite_three_success(ac: AsyncClient, users_tokens):
+async def test_decli_invite_three_success(ac: AsyncClient, users_tokens, invites_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test3@test.com']}",
     }
-    response = await ac.get("/invite/3/decline/", headers=headers)
+    response = await ac.get(f"/invite/{invites_ids[3]}/decline/", headers=headers)
     assert response.status_code == 200
     assert response.json().get('detail') == "success"
 
 
-async def test_members_only_owner(ac: AsyncClient, users_tokens):
+async def test_members_only_owner(ac: AsyncClient, users_tokens, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.get("/company/2/members", headers=headers)
+    response = await ac.get(f"/company/{companies_ids['test_company_2']}/members", headers=headers)
     assert response.status_code == 200
     assert len(response.json().get('result').get('users')) == 2
 
 
-async def test_accept_requests(ac: AsyncClient, users_tokens):
+async def test_accept_requests(ac: AsyncClient, users_tokens, invites_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test3@test.com']}",
     }
-    response = await ac.get("/invite/4/accept/", headers=headers)
+    response = await ac.get(f"/invite/{invites_ids[4]}/accept/", headers=headers)
     assert response.status_code == 200
 
 
-async def test_members_after_accept(ac: AsyncClient, users_tokens):
+async def test_members_after_accept(ac: AsyncClient, users_tokens, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.get("/company/2/members", headers=headers)
+    response = await ac.get(f"/company/{companies_ids['test_company_2']}/members", headers=headers)
     assert response.status_code == 200
     assert len(response.json().get('result').get('users')) == 3
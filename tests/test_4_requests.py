@@ -1,5 +1,15 @@
 from httpx import AsyncClient
 
+
+async def find_request_id(ac: AsyncClient, user_token: str, company_id: int) -> int:
+    headers = {
+        "Authorization": f"Bearer {user_token}",
+    }
+    response = await ac.get("/request/my", headers=headers)
+    for request in response.json().get('result'):
+        if request.get('to_company_id') == company_id:
+            return request.get('request_id')
+
 # send request
 
 async def test_send_request_not_auth(ac: AsyncClient):
@@ -17,7 +27,7 @@ async def test_send_request_not_found_company(ac: AsyncClient, users_tokens):
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
     payload = {
-        "to_company_id": 100,
+        "to_company_id": 1000000,
         "invite_message": "string"
     }
     response = await ac.post("/request/", json=payload, headers=headers)
@@ -25,12 +35,12 @@ async def test_send_request_not_found_company(ac: AsyncClient, users_tokens):
     assert response.json().get('detail') == 'Company does not exist'
 
 
-async def test_send_request_from_owner(ac: AsyncClient, users_tokens):
+async def test_send_request_from_owner(ac: AsyncClient, users_tokens, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
     payload = {
-        "to_company_id": 1,
+        "to_company_id": companies_ids["test_company_1"],
         "invite_message": "string"
     }
     response = await ac.post("/request/", json=payload, headers=headers)
@@ -38,12 +48,12 @@ async def test_send_request_from_owner(ac: AsyncClient, users_tokens):
     assert response.json().get('detail') == "User is already a member of the company"
 
 
-async def test_send_request_one_success(ac: AsyncClient, users_tokens):
+async def test_send_request_one_success(ac: AsyncClient, users_tokens, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
     payload = {
-        "to_company_id": 2,
+        "to_company_id": companies_ids["test_company_2"],
         "invite_message": "string"
     }
     response = await ac.post("/request/", json=payload, headers=headers)
@@ -51,38 +61,40 @@ async def test_send_request_one_success(ac: AsyncClient, users_tokens):
     assert response.json().get('detail') == "User is already a member of the company"
 
 
-async def test_send_request_two_success(ac: AsyncClient, users_tokens):
+async def test_send_request_two_success(ac: AsyncClient, users_tokens, companies_ids, requests_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
     payload = {
-        "to_company_id": 1,
+        "to_company_id": companies_ids["test_company_1"],
         "invite_message": "string"
     }
     response = await ac.post("/request/", json=payload, headers=headers)
     assert response.status_code == 200
     assert response.json().get('detail') == "success"
+    requests_ids[1] = await find_request_id(ac, users_tokens['test2@test.com'], companies_ids['test_company_1'])
 
 
-async def test_send_request_three_success(ac: AsyncClient, users_tokens):
+async def test_send_request_three_success(ac: AsyncClient, users_tokens, companies_ids, requests_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test3@test.com']}",
     }
     payload = {
-        "to_company_id": 1,
+        "to_company_id": companies_ids["test_company_1"],
         "invite_message": "string"
     }
     response = await ac.post("/request/", json=payload, headers=headers)
     assert response.status_code == 200
     assert response.json().get('detail') == "success"
+    requests_ids[2] = await find_request_id(ac, users_tokens['test3@test.com'], companies_ids['test_company_1'])
 
 
-async def test_send_request_exist(ac: AsyncClient, users_tokens):
+async def test_send_request_exist(ac: AsyncClient, users_tokens, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
     payload = {
-        "to_company_id": 1,
+        "to_company_id": companies_ids["test_company_1"],
         "invite_message": "string"
     }
     response = await ac.post("/request/", json=payload, headers=headers)
@@ -90,17 +102,18 @@ async def test_send_request_exist(ac: AsyncClient, users_tokens):
     assert response.json().get('detail') == "Request already sent"
 
 
-async def test_send_request_four_success(ac: AsyncClient, users_tokens):
+async def test_send_request_four_success(ac: AsyncClient, users_tokens, companies_ids, requests_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test4@test.com']}",
     }
     payload = {
-        "to_company_id": 2,
+        "to_company_id": companies_ids["test_company_2"],
         "invite_message": "string"
     }
     response = await ac.post("/request/", json=payload, headers=headers)
     assert response.status_code == 200
     assert response.json().get('detail') == "success"
+    requests_ids[3] = await find_request_id(ac, users_tokens['test4@test.com'], companies_ids['test_company_2'])
 
 
 # my requests
@@ -139,8 +152,8 @@ async def test_my_requests_user_three(ac: AsyncClient, users_tokens):
 
 # company requests
 
-async def test_company_requests_not_auth(ac: AsyncClient):
-    response = await ac.get("/request/company/1/")
+async def test_company_requests_not_auth(ac: AsyncClient, companies_ids):
+    response = await ac.get(f"/request/company/{companies_ids['test_company_1']}/")
     assert response.status_code == 403
 
 
@@ -148,25 +161,25 @@ async def test_requests_company_not_found(ac: AsyncClient, users_tokens):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.get("/request/company/100/", headers=headers)
+    response = await ac.get("/request/company/1000000/", headers=headers)
     assert response.status_code == 404
     assert response.json().get('detail') == "Company does not exist"
 
 
-async def test_requests_company_one_not_owner(ac: AsyncClient, users_tokens):
+async def test_requests_company_one_not_owner(ac: AsyncClient, users_tokens, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.get("/request/company/1/", headers=headers)
+    response = await ac.get(f"/request/company/{companies_ids['test_company_1']}/", headers=headers)
     assert response.status_code == 403
     assert response.json().get('detail') == "it's not your company"
 
 
-async def test_requests_company_one_success(ac: AsyncClient, users_tokens):
+async def test_requests_company_one_success(ac: AsyncClient, users_tokens, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.get("/request/company/1/", headers=headers)
+    response = await ac.get(f"/request/company/{companies_ids['test_company_1']}/", headers=headers)
     assert response.status_code == 200
     assert response.json().get('detail') == "success"
     assert len(response.json().get('result')) == 2
@@ -175,8 +188,8 @@ async def test_requests_company_one_success(ac: AsyncClient, users_tokens):
 # request cancel
 
 
-async def test_cancel_requests_not_auth(ac: AsyncClient):
-    response = await ac.delete("/request/1/")
+async def test_cancel_requests_not_auth(ac: AsyncClient, requests_ids):
+    response = await ac.delete(f"/request/{requests_ids[1]}/")
     assert response.status_code == 403
 
 
@@ -184,33 +197,33 @@ async def test_cancel_requests_not_found(ac: AsyncClient, users_tokens):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.delete("/request/12/", headers=headers)
+    response = await ac.delete("/request/1000000/", headers=headers)
     assert response.status_code == 404
     assert response.json().get('detail') == "Request not found"
 
 
-async def test_cancel_requests_not_your(ac: AsyncClient, users_tokens):
+async def test_cancel_requests_not_your(ac: AsyncClient, users_tokens, requests_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test3@test.com']}",
     }
-    response = await ac.delete("/request/1/", headers=headers)
+    response = await ac.delete(f"/request/{requests_ids[1]}/", headers=headers)
     assert response.status_code == 403
     assert response.json().get('detail') == "It's not your request"
 
 
-async def test_cancel_request_success(ac: AsyncClient, users_tokens):
+async def test_cancel_request_success(ac: AsyncClient, users_tokens, requests_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.delete("/request/1/", headers=headers)
+    response = await ac.delete(f"/request/{requests_ids[1]}/", headers=headers)
     assert response.status_code == 200
     assert response.json().get('detail') == "success"
 
 
 # accept request
 
-async def test_accept_requests_not_auth(ac: AsyncClient):
-    response = await ac.get("/request/2/accept/")
+async def test_accept_requests_not_auth(ac: AsyncClient, requests_ids):
+    response = await ac.get(f"/request/{requests_ids[2]}/accept/")
     assert response.status_code == 403
 
 
@@ -218,16 +231,16 @@ async def test_accept_requests_not_found(ac: AsyncClient, users_tokens):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.get("/request/12/accept/", headers=headers)
+    response = await ac.get("/request/1000000/accept/", headers=headers)
     assert response.status_code == 404
     assert response.json().get('detail') == "Request not found"
 
 
-async def test_accept_requests_not_owner(ac: AsyncClient, users_tokens):
+async def test_accept_requests_not_owner(ac: AsyncClient, users_tokens, requests_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.get("/request/2/accept/", headers=headers)
+    response = await ac.get(f"/request/{requests_ids[2]}/accept/", headers=headers)
     assert response.status_code == 403
     assert response.json().get('detail') == "Only the owner of the company can accept requests"
 
@@ -235,8 +248,8 @@ async def test_accept_requests_not_owner(ac: AsyncClient, users_tokens):
 # decli request
 
 
-async def test_decline_request_not_auth(ac: AsyncClient):
-    response = await ac.get('/request/3/decline')
+async def test_decline_request_not_auth(ac: AsyncClient, requests_ids):
+    response = await ac.get(f'/request/{requests_ids[3]}/decline')
     assert response.status_code == 403
     assert response.json().get('detail') == "Not authenticated"
 
@@ -245,25 +258,25 @@ async def test_decline_request_not_found(ac: AsyncClient, users_tokens):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.get('/request/100/decline', headers=headers)
+    response = await ac.get('/request/1000000/decline', headers=headers)
     assert response.status_code == 404
     assert response.json().get('detail') == "Request not found"
 
 
-async def test_decline_request_not_owner(ac: AsyncClient, users_tokens):
+async def test_decline_request_not_owner(ac: AsyncClient, users_tokens, requests_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.get('/request/2/decline', headers=headers)
+    response = await ac.get(f'/request/{requests_ids[2]}/decline', headers=headers)
     assert response.status_code == 403
     assert response.json().get('detail') == "Only the owner of the company can decline requests"
 
 
-async def test_decline_request_success(ac: AsyncClient, users_tokens):
+async def test_decline_request_success(ac: AsyncClient, users_tokens, requests_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test1@test.com']}",
     }
-    response = await ac.get('/request/2/decline', headers=headers)
+    response = await ac.get(f'/request/{requests_ids[2]}/decline', headers=headers)
     assert response.status_code == 200
     assert response.json().get('detail') == "success"
 
@@ -272,64 +285,64 @@ async def test_decline_request_success(ac: AsyncClient, users_tokens):
 #===============================
 
 
-async def test_members_only_owner(ac: AsyncClient, users_tokens):
+async def test_members_only_owner(ac: AsyncClient, users_tokens, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.get("/company/2/members", headers=headers)
+    response = await ac.get(f"/company/{companies_ids['test_company_2']}/members", headers=headers)
     assert response.status_code == 200
     assert len(response.json().get('result').get('users')) == 3
 
 
-async def test_accept_requests(ac: AsyncClient, users_tokens):
+async def test_accept_requests(ac: AsyncClient, users_tokens, requests_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.get("/request/3/accept/", headers=headers)
+    response = await ac.get(f"/request/{requests_ids[3]}/accept/", headers=headers)
     assert response.status_code == 200
 
 
-async def test_members_after_accept(ac: AsyncClient, users_tokens):
+async def test_members_after_accept(ac: AsyncClient, users_tokens, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.get("/company/2/members", headers=headers)
+    response = await ac.get(f"/company/{companies_ids['test_company_2']}/members", headers=headers)
     assert response.status_code == 200
     assert len(response.json().get('result').get('users')) == 4
 
 
 # ===========
 
-async def test_kick_member(ac: AsyncClient, users_tokens):
+async def test_kick_member(ac: AsyncClient, users_tokens, users_ids, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.delete("/company/2/member/3/", headers=headers)
+    response = await ac.delete(f"/company/{companies_ids['test_company_2']}/member/{users_ids['test3@test.com']}/", headers=headers)
     assert response.status_code == 200
 
 
-async def test_members_after_kick(ac: AsyncClient, users_tokens):
+async def test_members_after_kick(ac: AsyncClient, users_tokens, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.get("/company/2/members", headers=headers)
+    response = await ac.get(f"/company/{companies_ids['test_company_2']}/members", headers=headers)
     assert response.status_code == 200
     assert len(response.json().get('result').get('users')) == 3
 
 
-async def test_leave_member(ac: AsyncClient, users_tokens):
+async def test_leave_member(ac: AsyncClient, users_tokens, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test4@test.com']}",
     }
-    response = await ac.delete("/company/2/leave", headers=headers)
+    response = await ac.delete(f"/company/{companies_ids['test_company_2']}/leave", headers=headers)
     assert response.status_code == 200
 
 
-async def test_members_after_leave(ac: AsyncClient, users_tokens):
+async def test_members_after_leave(ac: AsyncClient, users_tokens, companies_ids):
     headers = {
         "Authorization": f"Bearer {users_tokens['test2@test.com']}",
     }
-    response = await ac.get("/company/2/members", headers=headers)
+    response = await ac.get(f"/company/{companies_ids['test_company_2']}/members", headers=headers)
     assert response.status_code == 200
     assert len(response.json().get('result').get('users')) == 2
 
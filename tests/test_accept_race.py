@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from httpx import AsyncClient
+
+
+PARALLEL_ACCEPTS = 50
+
+# each accept needs its own connection and transaction, one shared session can't race
+pytestmark = pytest.mark.usefixtures("pooled_db")
+
+
+async def fire(ac: AsyncClient, url: str, headers: dict) -> list:
+    responses = await asyncio.gather(*(ac.get(url, headers=headers) for _ in range(PARALLEL_ACCEPTS)))
+    return sorted((response.status_code, response.json().get('detail')) for response in responses)
+
+
+@pytest.fixture(scope='module')
+async def race(pooled_db, user_factory, company_factory) -> dict:
+    # created through the pool so the rows are committed before the racing transactions start
+    users = {name: await user_factory(f"race_{name}") for name in ("owner", "invited", "requester", "declined")}
+    return {**users, "company_id": await company_factory(users["owner"], "race")}
+
+
+async def test_race_invite_accept(ac: AsyncClient, race):
+    payload = {
+        "to_user_id": race["invited"]["user_id"],
+        "from_company_id": race["company_id"],
+        "invite_message": "string"
+    }
+    response = await ac.post("/invite/", json=payload, headers=race["owner"]["headers"])
+    assert response.status_code == 200
+    headers = race["invited"]["headers"]
+    response = await ac.get("/invite/my", headers=headers)
+    invite_id = response.json().get('result')[0].get('invite_id')
+
+    results = await fire(ac, f"/invite/{invite_id}/accept/", headers)
+    assert results == [(200, "success")] + [(404, "Invite not found")] * (PARALLEL_ACCEPTS - 1)
+
+
+async def test_race_request_accept(ac: AsyncClient, race):
+    payload = {
+        "to_company_id": race["company_id"],
+        "invite_message": "string"
+    }
+    headers = race["requester"]["headers"]
+    response = await ac.post("/request/", json=payload, headers=headers)
+    assert response.status_code == 200
+    response = await ac.get("/request/my", headers=headers)
+    request_id = response.json().get('result')[0].get('request_id')
+
+    results = await fire(ac, f"/request/{request_id}/accept/", race["owner"]["headers"])
+    assert results == [(200, "success")] + [(404, "Request not found")] * (PARALLEL_ACCEPTS - 1)
+
+
+async def test_race_members_once(ac: AsyncClient, race):
+    headers = race["owner"]["headers"]
+    response = await ac.get(f"/company/{race['company_id']}/members", headers=headers)
+    assert response.status_code == 200
+    members = [user.get("user_id") for user in response.json().get('result').get('users')]
+    assert sorted(members) == sorted([
+        race["owner"]["user_id"],
+        race["invited"]["user_id"],
+        race["requester"]["user_id"],
+    ])
+
+
+async def test_race_invite_decline(ac: AsyncClient, race):
+    payload = {
+        "to_user_id": race["declined"]["user_id"],
+        "from_company_id": race["company_id"],
+        "invite_message": "string"
+    }
+    response = await ac.post("/invite/", json=payload, headers=race["owner"]["headers"])
+    assert response.status_code == 200
+    headers = race["declined"]["headers"]
+    response = await ac.get("/invite/my", headers=headers)
+    invite_id = response.json().get('result')[0].get('invite_id')
+
+    results = await fire(ac, f"/invite/{invite_id}/decline/", headers)
+    assert results == [(200, "success")] + [(404, "Invite not found")] * (PARALLEL_ACCEPTS - 1)
+    response = await ac.get("/invite/my", headers=headers)
+    assert len(response.json().get('result')) == 0
+
+
+async def test_race_accept_errors_kept(ac: AsyncClient, race):
+    payload = {
+        "to_user_id": race["declined"]["user_id"],
+        "from_company_id": race["company_id"],
+        "invite_message": "string"
+    }
+    response = await ac.post("/invite/", json=payload, headers=race["owner"]["headers"])
+    assert response.status_code == 200
+    response = await ac.get("/invite/my", headers=race["declined"]["headers"])
+    invite_id = response.json().get('result')[0].get('invite_id')
+
+    response = await ac.get(f"/invite/{invite_id}/accept/", headers=race["invited"]["headers"])
+    assert response.status_code == 400
+    assert response.json().get('detail') == "It is not your invite"
+    response = await ac.get(f"/invite/{invite_id}/decline/", headers=race["invited"]["headers"])
+    assert response.status_code == 400
+    assert response.json().get('detail') == "User does not have an invite to the company"
+    response = await ac.get(f"/invite/{invite_id}/accept/", headers=race["declined"]["headers"])
+    assert response.status_code == 200
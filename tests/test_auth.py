@@ -0,0 +1,210 @@
+import asyncio
+import time
+
+import pytest
+
+from concurrent.futures import Executor
+from httpx import AsyncClient
+
+from core.config import system_config
+from core.hashing import make_hash_pool, password_hasher
+
+
+LOGIN_STORM = 200
+LOOP_PROBE_INTERVAL = 0.005
+LOOP_LAG_LIMIT = 0.05
+TOKEN_SECONDS = 1
+SLOW_HASH_ROUNDS = 12
+QUEUED_LOGINS = 4
+
+
+# token cache
+
+async def test_cached_token_repeated_auth_me(ac: AsyncClient, isolated, user_factory):
+    user = await user_factory("cache")
+    for _ in range(5):
+        response = await ac.get("/auth/me/", headers=user["headers"])
+        assert response.status_code == 200
+        assert response.json().get('result').get('user_id') == user["user_id"]
+        assert response.json().get('result').get('user_name') == user["user_name"]
+
+
+async def test_cached_token_no_repeat_lookup(ac: AsyncClient, isolated, user_factory, counting_db):
+    user = await user_factory("cache")
+    response = await ac.get("/auth/me/", headers=user["headers"])
+    assert response.status_code == 200
+    after_first = counting_db.queries
+    for _ in range(5):
+        response = await ac.get("/auth/me/", headers=user["headers"])
+        assert response.status_code == 200
+    assert counting_db.queries == after_first
+
+
+async def test_cached_token_expires(ac: AsyncClient, isolated, user_factory, monkeypatch):
+    # the cache entry must not outlive the token, even while it is being hit
+    monkeypatch.setattr(system_config, "access_token_expire_seconds", TOKEN_SECONDS)
+    user = await user_factory("cache")
+    response = await ac.get("/auth/me/", headers=user["headers"])
+    assert response.status_code == 200
+    await asyncio.sleep(TOKEN_SECONDS + 1)
+    response = await ac.get("/auth/me/", headers=user["headers"])
+    assert response.status_code == 401
+
+
+async def test_cached_token_tampered(ac: AsyncClient, isolated, user_factory):
+    user = await user_factory("cache")
+    headers = {
+        "Authorization": f"{user['headers']['Authorization']}x",
+    }
+    response = await ac.get("/auth/me/", headers=headers)
+    assert response.status_code == 401
+
+
+async def test_cached_token_other_user(ac: AsyncClient, isolated, user_factory):
+    first = await user_factory("cache")
+    second = await user_factory("cache")
+    for user in (first, second, first):
+        response = await ac.get("/auth/me/", headers=user["headers"])
+        assert response.status_code == 200
+        assert response.json().get('result').get('user_id') == user["user_id"]
+
+
+async def test_cached_token_invalidated_on_update(ac: AsyncClient, isolated, user_factory):
+    user = await user_factory("cache")
+    response = await ac.get("/auth/me/", headers=user["headers"])
+    assert response.status_code == 200
+    new_name = f"{user['user_name']}NEW"
+    response = await ac.put(f"/user/{user['user_id']}/", json={"user_name": new_name}, headers=user["headers"])
+    assert response.status_code == 200
+    response = await ac.get("/auth/me/", headers=user["headers"])
+    assert response.status_code == 200
+    assert response.json().get('result').get('user_name') == new_name
+
+
+async def test_cached_token_invalidated_on_delete(ac: AsyncClient, isolated, user_factory):
+    user = await user_factory("cache")
+    response = await ac.get("/auth/me/", headers=user["headers"])
+    assert response.status_code == 200
+    response = await ac.delete(f"/user/{user['user_id']}/", headers=user["headers"])
+    assert response.status_code == 200
+    response = await ac.get("/auth/me/", headers=user["headers"])
+    assert response.status_code == 401
+    response = await ac.get("/users/", headers=user["headers"])
+    assert response.status_code == 401
+
+
+async def test_cached_token_not_shared_after_delete(ac: AsyncClient, isolated, user_factory):
+    kept = await user_factory("cache")
+    deleted = await user_factory("cache")
+    for user in (kept, deleted):
+        response = await ac.get("/auth/me/", headers=user["headers"])
+        assert response.status_code == 200
+    response = await ac.delete(f"/user/{deleted['user_id']}/", headers=deleted["headers"])
+    assert response.status_code == 200
+    response = await ac.get("/auth/me/", headers=kept["headers"])
+    assert response.status_code == 200
+    assert response.json().get('result').get('user_id') == kept["user_id"]
+
+
+# password hashing
+
+def stored_password(db, users_table, user_email: str):
+    query = users_table.select().where(users_table.c.user_email == user_email)
+    return db.fetch_val(query, column=users_table.c.user_password)
+
+
+async def test_hashing_create_user(db, users_table, isolated, user_factory):
+    user = await user_factory("hash")
+    assert await stored_password(db, users_table, user["user_email"]) != user["user_name"]
+
+
+async def test_hashing_login_same_cost_keeps_hash(login_user, db, users_table, isolated, user_factory):
+    user = await user_factory("hash")
+    before = await stored_password(db, users_table, user["user_email"])
+    response = await login_user(user["user_email"], user["user_name"])
+    assert response.status_code == 200
+    assert await stored_password(db, users_table, user["user_email"]) == before
+
+
+async def test_hashing_rehash_on_login(login_user, db, users_table, isolated, user_factory, monkeypatch):
+    user = await user_factory("hash")
+    before = await stored_password(db, users_table, user["user_email"])
+    rounds = system_config.password_hash_rounds
+    monkeypatch.setattr(system_config, "password_hash_rounds", 5 if rounds == 4 else 4)
+    response = await login_user(user["user_email"], user["user_name"])
+    assert response.status_code == 200
+    after = await stored_password(db, users_table, user["user_email"])
+    assert after != before
+    response = await login_user(user["user_email"], user["user_name"])
+    assert response.status_code == 200
+    assert await stored_password(db, users_table, user["user_email"]) == after
+
+    response = await login_user(user["user_email"], "hash_bad")
+    assert response.status_code == 401
+    assert response.json().get('detail') == 'Incorrect username or password'
+
+
+@pytest.fixture
+def single_hash_worker(monkeypatch) -> Executor:
+    # the app builds its pool once from password_hash_workers, so swap in one of our own
+    pool = make_hash_pool(1)
+    monkeypatch.setattr(password_hasher, "pool", pool)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+@pytest.mark.benchmark
+async def test_hashing_login_storm_event_loop_lag(ac: AsyncClient, isolated, user_factory):
+    user = await user_factory("hash")
+    lags = []
+    done = asyncio.Event()
+
+    async def probe():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(LOOP_PROBE_INTERVAL)
+            lags.append(time.perf_counter() - start - LOOP_PROBE_INTERVAL)
+
+    async def login():
+        payload = {
+            "user_email": user["user_email"],
+            "user_password": user["user_name"],
+        }
+        return await ac.post("/auth/login/", json=payload)
+
+    probe_task = asyncio.create_task(probe())
+    responses = await asyncio.gather(*(login() for _ in range(LOGIN_STORM)))
+    done.set()
+    await probe_task
+
+    assert all(response.status_code == 200 for response in responses)
+    lags.sort()
+    assert lags[int(len(lags) * 0.99) - 1] < LOOP_LAG_LIMIT
+
+
+def test_hashing_pool_factory():
+    assert system_config.password_hash_workers >= 1
+    assert isinstance(password_hasher.pool, Executor)
+    pool = make_hash_pool(system_config.password_hash_workers)
+    assert isinstance(pool, Executor)
+    pool.shutdown(wait=True)
+
+
+async def test_hashing_workers_limit(login_user, isolated, user_factory, single_hash_worker, monkeypatch):
+    # with a single hashing worker concurrent logins can't overlap, so they take about as long
+    # as running them one after another; slow hashes keep request overhead out of the picture
+    monkeypatch.setattr(system_config, "password_hash_rounds", SLOW_HASH_ROUNDS)
+    user = await user_factory("hash")
+
+    start = time.perf_counter()
+    response = await login_user(user["user_email"], user["user_name"])
+    single = time.perf_counter() - start
+    assert response.status_code == 200
+
+    start = time.perf_counter()
+    responses = await asyncio.gather(*(
+        login_user(user["user_email"], user["user_name"]) for _ in range(QUEUED_LOGINS)
+    ))
+    queued = time.perf_counter() - start
+    assert all(response.status_code == 200 for response in responses)
+    assert queued >= single * (QUEUED_LOGINS - 1)
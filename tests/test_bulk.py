@@ -0,0 +1,161 @@
+import json
+
+from httpx import AsyncClient
+
+
+BULK_USERS = 200
+
+
+def user_payload(name: str, password: str = None, password_repeat: str = None, email: str = None) -> dict:
+    password = password or name
+    return {
+        "user_password": password,
+        "user_password_repeat": password_repeat or password,
+        "user_email": email or f"{name}@test.com",
+        "user_name": name,
+    }
+
+
+async def bulk_create(ac: AsyncClient, names: list) -> list:
+    response = await ac.post("/users/bulk", json=[user_payload(name) for name in names])
+    assert response.status_code == 200
+    result = response.json().get("result")
+    assert all(row.get("status_code") == 200 for row in result)
+    return [row.get("user_id") for row in result]
+
+
+# bulk users
+
+async def test_bulk_users_mixed(ac: AsyncClient, isolated, user_factory, login_user):
+    existing = await user_factory("bulk")
+    payload = [
+        user_payload("bulk1"),
+        user_payload("bulk2", password_repeat="bulk3"),
+        user_payload("bulk3", password="tet"),
+        user_payload("bulk4", email="bulk4"),
+        user_payload("bulk5", email=existing["user_email"]),
+        user_payload("bulk6"),
+        user_payload("bulk7", email="bulk6@test.com"),
+    ]
+    response = await ac.post("/users/bulk", json=payload)
+    assert response.status_code == 200
+    result = response.json().get("result")
+    assert len(result) == len(payload)
+    assert [row.get("status_code") for row in result] == [200, 422, 422, 422, 400, 200, 400]
+    assert result[4].get("detail") == "email exist"
+    assert result[6].get("detail") == "email exist"
+    assert result[0].get("user_id") != result[5].get("user_id")
+
+    response = await login_user("bulk1@test.com", "bulk1")
+    assert response.status_code == 200
+    response = await login_user("bulk2@test.com", "bulk2")
+    assert response.status_code == 401
+    response = await ac.get(f"/user/{result[5].get('user_id')}/", headers=existing["headers"])
+    assert response.status_code == 200
+    assert response.json().get('result').get('user_name') == "bulk6"
+    assert response.json().get('result').get('user_password') == None
+
+
+async def test_bulk_users_ndjson(ac: AsyncClient, isolated):
+    rows = [user_payload("bulk_nd1"), user_payload("bulk_nd2"), user_payload("bulk_nd1")]
+    content = "\n".join(json.dumps(row) for row in rows) + "\n"
+    headers = {
+        "Content-Type": "application/x-ndjson",
+    }
+    response = await ac.post("/users/bulk", content=content, headers=headers)
+    assert response.status_code == 200
+    assert [row.get("status_code") for row in response.json().get("result")] == [200, 200, 400]
+
+
+async def test_bulk_users_bad_body(ac: AsyncClient):
+    response = await ac.post("/users/bulk", json={"user_email": "bulk@test.com"})
+    assert response.status_code == 422
+
+
+async def test_bulk_users_many(ac: AsyncClient, db, users_table, isolated):
+    ids = await bulk_create(ac, [f"bulk_many{i}" for i in range(BULK_USERS)])
+    assert len(set(ids)) == BULK_USERS
+    query = users_table.select().where(users_table.c.user_email.like("bulk_many%"))
+    assert len(await db.fetch_all(query)) == BULK_USERS
+
+
+# bulk invites
+
+async def test_bulk_invites_not_auth(ac: AsyncClient):
+    payload = {
+        "from_company_id": 1000000,
+        "to_user_ids": [1],
+        "invite_message": "string"
+    }
+    response = await ac.post("/invite/bulk", json=payload)
+    assert response.status_code == 403
+    assert response.json().get('detail') == "Not authenticated"
+
+
+async def test_bulk_invites_not_found_company(ac: AsyncClient, isolated, user_factory):
+    owner = await user_factory("bulk_owner")
+    payload = {
+        "from_company_id": 1000000,
+        "to_user_ids": [owner["user_id"]],
+        "invite_message": "string"
+    }
+    response = await ac.post("/invite/bulk", json=payload, headers=owner["headers"])
+    assert response.status_code == 404
+    assert response.json().get('detail') == 'This company not found'
+
+
+async def test_bulk_invites_not_your_company(ac: AsyncClient, isolated, user_factory, company_factory):
+    owner = await user_factory("bulk_owner")
+    other = await user_factory("bulk_user")
+    payload = {
+        "from_company_id": await company_factory(owner),
+        "to_user_ids": [owner["user_id"]],
+        "invite_message": "string"
+    }
+    response = await ac.post("/invite/bulk", json=payload, headers=other["headers"])
+    assert response.status_code == 403
+    assert response.json().get('detail') == "it's not your company"
+
+
+async def test_bulk_invites_mixed(ac: AsyncClient, isolated, user_factory, company_factory):
+    owner = await user_factory("bulk_owner")
+    invited = await user_factory("bulk_user")
+    company_id = await company_factory(owner)
+    many_ids = await bulk_create(ac, [f"bulk_many{i}" for i in range(BULK_USERS)])
+    to_user_ids = [invited["user_id"], owner["user_id"], 1000000, invited["user_id"]]
+    payload = {
+        "from_company_id": company_id,
+        "to_user_ids": to_user_ids + many_ids,
+        "invite_message": "string"
+    }
+    response = await ac.post("/invite/bulk", json=payload, headers=owner["headers"])
+    assert response.status_code == 200
+    result = response.json().get("result")
+    assert [row.get("to_user_id") for row in result] == to_user_ids + many_ids
+    assert [row.get("status_code") for row in result[:4]] == [200, 400, 404, 400]
+    assert result[1].get("detail") == "User is already a member of the company"
+    assert result[2].get("detail") == "This user not found"
+    assert all(row.get("status_code") == 200 for row in result[4:])
+
+    response = await ac.get(f"/invite/company/{company_id}/", headers=owner["headers"])
+    assert response.status_code == 200
+    assert len(response.json().get('result')) == BULK_USERS + 1
+    response = await ac.get("/invite/my", headers=invited["headers"])
+    assert response.status_code == 200
+    assert len(response.json().get('result')) == 1
+
+
+async def test_bulk_invites_repeat(ac: AsyncClient, isolated, user_factory, company_factory):
+    owner = await user_factory("bulk_owner")
+    invited = await user_factory("bulk_user")
+    payload = {
+        "from_company_id": await company_factory(owner),
+        "to_user_ids": [invited["user_id"]],
+        "invite_message": "string"
+    }
+    response = await ac.post("/invite/bulk", json=payload, headers=owner["headers"])
+    assert response.status_code == 200
+    assert response.json().get("result")[0].get("status_code") == 200
+    response = await ac.post("/invite/bulk", json=payload, headers=owner["headers"])
+    assert response.status_code == 200
+    assert response.json().get("result")[0].get("status_code") == 400
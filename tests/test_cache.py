@@ -0,0 +1,191 @@
+from httpx import AsyncClient
+
+from core.cache import company_cache
+
+
+class DictBackend:
+    # minimal stand-in for a shared store behind the same interface as the in-memory backend
+    def __init__(self):
+        self.store = dict()
+        self.calls = []
+
+    async def get(self, key: str):
+        self.calls.append("get")
+        return self.store.get(key)
+
+    async def set(self, key: str, value):
+        self.calls.append("set")
+        self.store[key] = value
+
+    async def delete(self, key: str):
+        self.calls.append("delete")
+        self.store.pop(key, None)
+
+
+async def get_company(ac: AsyncClient, user: dict, company_id: int):
+    return await ac.get(f"/company/{company_id}/", headers=user["headers"])
+
+
+async def get_members(ac: AsyncClient, user: dict, company_id: int) -> list:
+    response = await ac.get(f"/company/{company_id}/members", headers=user["headers"])
+    assert response.status_code == 200
+    return response.json().get('result').get('users')
+
+
+async def join_by_invite(ac: AsyncClient, owner: dict, user: dict, company_id: int):
+    payload = {
+        "to_user_id": user["user_id"],
+        "from_company_id": company_id,
+        "invite_message": "string"
+    }
+    response = await ac.post("/invite/", json=payload, headers=owner["headers"])
+    assert response.status_code == 200
+    response = await ac.get("/invite/my", headers=user["headers"])
+    invite_id = response.json().get('result')[0].get('invite_id')
+    response = await ac.get(f"/invite/{invite_id}/accept/", headers=user["headers"])
+    assert response.status_code == 200
+
+
+async def test_cache_company_hit(ac: AsyncClient, isolated, user_factory, company_factory):
+    owner = await user_factory("cache_owner")
+    first = await user_factory("cache_member")
+    second = await user_factory("cache_member")
+    company_id = await company_factory(owner)
+    hits, misses = company_cache.hits, company_cache.misses
+    response = await get_company(ac, first, company_id)
+    assert response.status_code == 200
+    assert company_cache.misses == misses + 1
+    response = await get_company(ac, second, company_id)
+    assert response.status_code == 200
+    assert response.json().get("result").get("company_id") == company_id
+    assert company_cache.hits == hits + 1
+    assert company_cache.misses == misses + 1
+
+
+async def test_cache_members_hit(ac: AsyncClient, isolated, user_factory, company_factory):
+    owner = await user_factory("cache_owner")
+    company_id = await company_factory(owner)
+    hits = company_cache.hits
+    assert len(await get_members(ac, owner, company_id)) == 1
+    assert len(await get_members(ac, owner, company_id)) == 1
+    assert company_cache.hits == hits + 1
+
+
+async def test_cache_invalidated_on_update(ac: AsyncClient, isolated, user_factory, company_factory):
+    owner = await user_factory("cache_owner")
+    member = await user_factory("cache_member")
+    company_id = await company_factory(owner)
+    response = await get_company(ac, member, company_id)
+    assert response.status_code == 200
+    payload = {
+        "company_name": "cache_company_NEW",
+        "company_description": "cache_company_description_NEW"
+    }
+    response = await ac.put(f"/company/{company_id}/", json=payload, headers=owner["headers"])
+    assert response.status_code == 200
+    response = await get_company(ac, member, company_id)
+    assert response.status_code == 200
+    assert response.json().get("result").get("company_name") == "cache_company_NEW"
+    assert response.json().get("result").get("company_description") == "cache_company_description_NEW"
+
+
+async def test_cache_invalidated_on_invite_accept(ac: AsyncClient, isolated, user_factory, company_factory):
+    owner = await user_factory("cache_owner")
+    member = await user_factory("cache_member")
+    company_id = await company_factory(owner)
+    assert len(await get_members(ac, owner, company_id)) == 1
+    await join_by_invite(ac, owner, member, company_id)
+    assert len(await get_members(ac, owner, company_id)) == 2
+
+
+async def test_cache_invalidated_on_request_accept(ac: AsyncClient, isolated, user_factory, company_factory):
+    owner = await user_factory("cache_owner")
+    member = await user_factory("cache_member")
+    company_id = await company_factory(owner)
+    assert len(await get_members(ac, owner, company_id)) == 1
+    payload = {
+        "to_company_id": company_id,
+        "invite_message": "string"
+    }
+    response = await ac.post("/request/", json=payload, headers=member["headers"])
+    assert response.status_code == 200
+    response = await ac.get("/request/my", headers=member["headers"])
+    request_id = response.json().get('result')[0].get('request_id')
+    response = await ac.get(f"/request/{request_id}/accept/", headers=owner["headers"])
+    assert response.status_code == 200
+    assert len(await get_members(ac, owner, company_id)) == 2
+
+
+async def test_cache_invalidated_on_kick(ac: AsyncClient, isolated, user_factory, company_factory):
+    owner = await user_factory("cache_owner")
+    member = await user_factory("cache_member")
+    company_id = await company_factory(owner)
+    await join_by_invite(ac, owner, member, company_id)
+    assert len(await get_members(ac, owner, company_id)) == 2
+    response = await ac.delete(f"/company/{company_id}/member/{member['user_id']}/", headers=owner["headers"])
+    assert response.status_code == 200
+    assert len(await get_members(ac, owner, company_id)) == 1
+
+
+async def test_cache_invalidated_on_leave(ac: AsyncClient, isolated, user_factory, company_factory):
+    owner = await user_factory("cache_owner")
+    member = await user_factory("cache_member")
+    company_id = await company_factory(owner)
+    await join_by_invite(ac, owner, member, company_id)
+    assert len(await get_members(ac, owner, company_id)) == 2
+    response = await ac.delete(f"/company/{company_id}/leave", headers=member["headers"])
+    assert response.status_code == 200
+    assert len(await get_members(ac, owner, company_id)) == 1
+
+
+async def test_cache_other_company_still_cached(ac: AsyncClient, isolated, user_factory, company_factory):
+    owner = await user_factory("cache_owner")
+    member = await user_factory("cache_member")
+    company_id = await company_factory(owner)
+    other_company_id = await company_factory(owner)
+    response = await get_company(ac, owner, other_company_id)
+    assert response.status_code == 200
+    await get_members(ac, owner, other_company_id)
+
+    response = await ac.put(f"/company/{company_id}/", json={"company_name": "cache_company_NEW"}, headers=owner["headers"])
+    assert response.status_code == 200
+    await join_by_invite(ac, owner, member, company_id)
+
+    hits, misses = company_cache.hits, company_cache.misses
+    response = await get_company(ac, owner, other_company_id)
+    assert response.status_code == 200
+    await get_members(ac, owner, other_company_id)
+    assert company_cache.hits == hits + 2
+    assert company_cache.misses == misses
+
+
+async def test_cache_invalidated_on_delete(ac: AsyncClient, isolated, user_factory, company_factory):
+    owner = await user_factory("cache_owner")
+    member = await user_factory("cache_member")
+    company_id = await company_factory(owner)
+    response = await get_company(ac, member, company_id)
+    assert response.status_code == 200
+    response = await ac.delete(f"/company/{company_id}/", headers=owner["headers"])
+    assert response.status_code == 200
+    response = await get_company(ac, member, company_id)
+    assert response.status_code == 404
+
+
+async def test_cache_pluggable_backend(ac: AsyncClient, isolated, user_factory, company_factory, monkeypatch):
+    owner = await user_factory("cache_owner")
+    # a company of its own, the real backend never sees it, so nothing stale is left behind
+    # when monkeypatch puts that backend back
+    backend = DictBackend()
+    monkeypatch.setattr(company_cache, "backend", backend)
+    company_id = await company_factory(owner)
+    backend.calls.clear()
+    for _ in range(2):
+        response = await get_company(ac, owner, company_id)
+        assert response.status_code == 200
+        assert response.json().get("result").get("company_id") == company_id
+    assert backend.calls == ["get", "set", "get"]
+    response = await ac.put(f"/company/{company_id}/", json={"company_name": "cache_company_plug_NEW"}, headers=owner["headers"])
+    assert response.status_code == 200
+    assert "delete" in backend.calls
+    response = await get_company(ac, owner, company_id)
+    assert response.json().get("result").get("company_name") == "cache_company_plug_NEW"
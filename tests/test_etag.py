@@ -0,0 +1,97 @@
+from httpx import AsyncClient
+
+
+async def get_etag(ac: AsyncClient, url: str, headers: dict) -> str:
+    response = await ac.get(url, headers=headers)
+    assert response.status_code == 200
+    etag = response.headers.get("etag")
+    assert etag
+    return etag
+
+
+async def assert_not_modified(ac: AsyncClient, url: str, headers: dict, etag: str):
+    response = await ac.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers.get("etag") == etag
+
+
+async def assert_modified(ac: AsyncClient, url: str, headers: dict, etag: str):
+    response = await ac.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers.get("etag") != etag
+
+
+async def send_invite(ac: AsyncClient, owner: dict, user: dict, company_id: int):
+    payload = {
+        "to_user_id": user["user_id"],
+        "from_company_id": company_id,
+        "invite_message": "string"
+    }
+    response = await ac.post("/invite/", json=payload, headers=owner["headers"])
+    assert response.status_code == 200
+
+
+async def test_etag_stable(ac: AsyncClient, isolated, user_factory, company_factory):
+    owner = await user_factory("etag_owner")
+    company_id = await company_factory(owner)
+    for url in ("/users/", "/invite/my", "/request/my", f"/company/{company_id}/members"):
+        etag = await get_etag(ac, url, owner["headers"])
+        assert await get_etag(ac, url, owner["headers"]) == etag
+        await assert_not_modified(ac, url, owner["headers"], etag)
+
+
+async def test_etag_if_none_match_list(ac: AsyncClient, isolated, user_factory):
+    user = await user_factory("etag_user")
+    etag = await get_etag(ac, "/invite/my", user["headers"])
+    await assert_not_modified(ac, "/invite/my", user["headers"], f'"other", {etag}')
+
+
+async def test_etag_not_auth(ac: AsyncClient):
+    response = await ac.get("/invite/my", headers={"If-None-Match": '"anything"'})
+    assert response.status_code == 403
+
+
+async def test_etag_invites_changed(ac: AsyncClient, isolated, user_factory, company_factory):
+    owner = await user_factory("etag_owner")
+    user = await user_factory("etag_user")
+    company_id = await company_factory(owner)
+    etag = await get_etag(ac, "/invite/my", user["headers"])
+    await send_invite(ac, owner, user, company_id)
+    await assert_modified(ac, "/invite/my", user["headers"], etag)
+
+
+async def test_etag_requests_changed(ac: AsyncClient, isolated, user_factory, company_factory):
+    owner = await user_factory("etag_owner")
+    user = await user_factory("etag_user")
+    company_id = await company_factory(owner)
+    etag = await get_etag(ac, "/request/my", user["headers"])
+    payload = {
+        "to_company_id": company_id,
+        "invite_message": "string"
+    }
+    response = await ac.post("/request/", json=payload, headers=user["headers"])
+    assert response.status_code == 200
+    await assert_modified(ac, "/request/my", user["headers"], etag)
+
+
+async def test_etag_members_changed(ac: AsyncClient, isolated, user_factory, company_factory):
+    owner = await user_factory("etag_owner")
+    user = await user_factory("etag_user")
+    company_id = await company_factory(owner)
+    etag = await get_etag(ac, f"/company/{company_id}/members", owner["headers"])
+    await send_invite(ac, owner, user, company_id)
+    response = await ac.get("/invite/my", headers=user["headers"])
+    invite_id = response.json().get('result')[0].get('invite_id')
+    response = await ac.get(f"/invite/{invite_id}/accept/", headers=user["headers"])
+    assert response.status_code == 200
+    await assert_modified(ac, f"/company/{company_id}/members", owner["headers"], etag)
+
+
+async def test_etag_users_changed(ac: AsyncClient, isolated, user_factory):
+    user = await user_factory("etag_user")
+    url = "/users/?sort=-user_id&limit=10"
+    etag = await get_etag(ac, url, user["headers"])
+    response = await ac.put(f"/user/{user['user_id']}/", json={"user_name": "etag_user_NEW"}, headers=user["headers"])
+    assert response.status_code == 200
+    await assert_modified(ac, url, user["headers"], etag)
@@ -0,0 +1,87 @@
+import pytest
+
+from httpx import AsyncClient
+
+
+async def create_company(ac: AsyncClient, owner: dict, company_name: str) -> dict:
+    response = await ac.post("/company/", json={"company_name": company_name}, headers=owner["headers"])
+    assert response.status_code == 201
+    return {"company_id": response.json().get("result").get("company_id"), "company_name": company_name}
+
+
+@pytest.fixture(scope='module')
+async def inbox(ac: AsyncClient, user_factory, unique_name) -> dict:
+    # user has a company of their own, an invite from one of owner's companies and a request to the other
+    user = await user_factory("inbox_user")
+    owner = await user_factory("inbox_owner")
+    companies = {
+        "invites": await create_company(ac, owner, unique_name("inbox_invites")),
+        "requests": await create_company(ac, owner, unique_name("inbox_requests")),
+        "own": await create_company(ac, user, unique_name("inbox_own")),
+    }
+
+    payload = {
+        "to_user_id": user["user_id"],
+        "from_company_id": companies["invites"]["company_id"],
+        "invite_message": "string"
+    }
+    response = await ac.post("/invite/", json=payload, headers=owner["headers"])
+    assert response.status_code == 200
+    payload = {
+        "to_company_id": companies["requests"]["company_id"],
+        "invite_message": "string"
+    }
+    response = await ac.post("/request/", json=payload, headers=user["headers"])
+    assert response.status_code == 200
+    return {"user": user, "owner": owner, "companies": companies}
+
+
+async def test_inbox_not_auth(ac: AsyncClient):
+    response = await ac.get("/inbox/")
+    assert response.status_code == 403
+    assert response.json().get('detail') == "Not authenticated"
+
+
+async def test_inbox_empty(ac: AsyncClient, inbox):
+    response = await ac.get("/inbox/", headers=inbox["owner"]["headers"])
+    assert response.status_code == 200
+    result = response.json().get("result")
+    assert result.get("user").get("user_id") == inbox["owner"]["user_id"]
+    assert result.get("invites") == []
+    assert result.get("requests") == []
+    assert len(result.get("companies")) == 2
+
+
+async def test_inbox_matches_single_endpoints(ac: AsyncClient, inbox):
+    headers = inbox["user"]["headers"]
+    response = await ac.get("/inbox/", headers=headers)
+    assert response.status_code == 200
+    assert response.json().get("detail") == "success"
+    result = response.json().get("result")
+
+    me = await ac.get("/auth/me/", headers=headers)
+    invites = await ac.get("/invite/my", headers=headers)
+    requests = await ac.get("/request/my", headers=headers)
+    assert result.get("user") == me.json().get("result")
+    assert result.get("user").get("user_password") == None
+    assert result.get("invites") == invites.json().get("result")
+    assert result.get("requests") == requests.json().get("result")
+    assert result.get("companies") == [inbox["companies"]["own"]]
+
+
+async def test_inbox_after_accept(ac: AsyncClient, inbox):
+    headers = inbox["user"]["headers"]
+    response = await ac.get("/inbox/", headers=headers)
+    invite_id = response.json().get("result").get("invites")[0].get("invite_id")
+    response = await ac.get(f"/invite/{invite_id}/accept/", headers=headers)
+    assert response.status_code == 200
+
+    response = await ac.get("/inbox/", headers=headers)
+    result = response.json().get("result")
+    assert result.get("invites") == []
+    assert len(result.get("requests")) == 1
+    companies = sorted((company.get("company_id"), company.get("company_name")) for company in result.get("companies"))
+    assert companies == sorted(
+        (company.get("company_id"), company.get("company_name"))
+        for company in (inbox["companies"]["own"], inbox["companies"]["invites"])
+    )
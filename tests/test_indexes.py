@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from httpx import AsyncClient
+from sqlalchemy import Column, Table, UniqueConstraint
+
+from db.models import Base
+
+
+CONCURRENT_REQUESTS = 20
+
+
+def fk_column(table: Table, target: Table) -> Column:
+    for column in table.columns:
+        if any(fk.column.table is target for fk in column.foreign_keys):
+            return column
+    return None
+
+
+@pytest.fixture(scope='module')
+def pair_tables(users_table, companies_table):
+    # membership, invite and request tables all link one company with one user
+    pairs = []
+    for table in Base.metadata.sorted_tables:
+        company_column = fk_column(table, companies_table)
+        user_column = fk_column(table, users_table)
+        if company_column is not None and user_column is not None:
+            pairs.append((table, company_column, user_column))
+    return pairs
+
+
+async def explain(db, query: str) -> str:
+    async with db.transaction(force_rollback=True):
+        await db.execute("SET LOCAL enable_seqscan = off")
+        rows = await db.fetch_all(f"EXPLAIN {query}")
+    return "\n".join(row[0] for row in rows)
+
+
+def test_pair_tables_found(pair_tables):
+    assert len(pair_tables) >= 3
+
+
+def test_pair_tables_unique(pair_tables):
+    for table, company_column, user_column in pair_tables:
+        unique_sets = [
+            {column.name for column in constraint.columns}
+            for constraint in table.constraints
+            if isinstance(constraint, UniqueConstraint)
+        ]
+        unique_sets += [
+            {column.name for column in index.columns}
+            for index in table.indexes
+            if index.unique
+        ]
+        assert {company_column.name, user_column.name} in unique_sets, table.name
+
+
+async def test_pair_lookup_uses_index(db, pair_tables):
+    for table, company_column, user_column in pair_tables:
+        plan = await explain(
+            db,
+            f'SELECT * FROM "{table.name}" '
+            f'WHERE "{company_column.name}" = 1 AND "{user_column.name}" = 1'
+        )
+        assert "Index" in plan, plan
+        assert "Seq Scan" not in plan, plan
+
+
+async def test_company_lookup_uses_index(db, pair_tables):
+    for table, company_column, _ in pair_tables:
+        plan = await explain(db, f'SELECT * FROM "{table.name}" WHERE "{company_column.name}" = 1')
+        assert "Index" in plan, plan
+        assert "Seq Scan" not in plan, plan
+
+
+async def test_search_columns_indexed(db, users_table, companies_table):
+    # substring and prefix matches both need a trigram index, a btree can't serve ILIKE '%q%'
+    for table, column_name in (
+        (users_table, "user_name"),
+        (users_table, "user_email"),
+        (companies_table, "company_name"),
+        (companies_table, "company_description"),
+    ):
+        for pattern in ("%qzebra%", "qzebra%"):
+            plan = await explain(db, f'SELECT * FROM "{table.name}" WHERE "{column_name}" ILIKE \'{pattern}\'')
+            assert "Index" in plan, plan
+            assert "Seq Scan" not in plan, plan
+
+
+async def test_concurrent_duplicate_request(ac: AsyncClient, pooled_db, create_user, login_user, users_tokens):
+    # a unique violation on the shared rollback session would abort it for the rest of the run,
+    # and concurrent inserts only race on separate connections
+    response = await create_user("index1@test.com", "index1", "index1")
+    assert response.status_code == 200
+    response = await create_user("index2@test.com", "index2", "index2")
+    assert response.status_code == 200
+    await login_user("index1@test.com", "index1")
+    await login_user("index2@test.com", "index2")
+    headers = {
+        "Authorization": f"Bearer {users_tokens['index1@test.com']}",
+    }
+    response = await ac.post("/company/", json={"company_name": "index_company"}, headers=headers)
+    assert response.status_code == 201
+    company_id = response.json().get("result").get("company_id")
+
+    headers = {
+        "Authorization": f"Bearer {users_tokens['index2@test.com']}",
+    }
+    payload = {
+        "to_company_id": company_id,
+        "invite_message": "string"
+    }
+    responses = await asyncio.gather(*(
+        ac.post("/request/", json=payload, headers=headers) for _ in range(CONCURRENT_REQUESTS)
+    ))
+    statuses = sorted(response.status_code for response in responses)
+    assert statuses == [200] + [400] * (CONCURRENT_REQUESTS - 1)
+    assert all(
+        response.json().get('detail') == "Request already sent"
+        for response in responses if response.status_code == 400
+    )
@@ -0,0 +1,111 @@
+import pytest
+
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+
+SORT_PAGE_LIMIT = 50
+
+
+@pytest.fixture(scope='module')
+async def fields(ac: AsyncClient, user_factory, unique_name) -> dict:
+    # owner has two companies with long descriptions, other has none
+    owner = await user_factory("fields")
+    other = await user_factory("fields")
+    companies = []
+    for _ in range(2):
+        payload = {
+            "company_name": unique_name("fields_company"),
+            "company_description": "large description " * 100
+        }
+        response = await ac.post("/company/", json=payload, headers=owner["headers"])
+        assert response.status_code == 201
+        companies.append({"company_id": response.json().get("result").get("company_id"), "company_name": payload["company_name"]})
+    return {"owner": owner, "other": other, "companies": companies}
+
+
+async def test_fields_users(ac: AsyncClient, fields):
+    headers = fields["owner"]["headers"]
+    response = await ac.get("/users/", params={"fields": "user_id,user_name"}, headers=headers)
+    assert response.status_code == 200
+    assert set(response.json().keys()) == {"status_code", "detail", "result"}
+    users = response.json().get("result").get("users")
+    assert len(users) > 0
+    assert all(set(user.keys()) == {"user_id", "user_name"} for user in users)
+
+
+async def test_fields_users_bad(ac: AsyncClient, fields):
+    headers = fields["owner"]["headers"]
+    for fields in ("user_id,no_such_field", "user_password"):
+        response = await ac.get("/users/", params={"fields": fields}, headers=headers)
+        assert response.status_code == 422
+
+
+async def test_sort_users_desc(ac: AsyncClient, db, users_table, fields):
+    headers = fields["owner"]["headers"]
+    total = await db.fetch_val(select(func.count()).select_from(users_table))
+    ids = []
+    params = {"sort": "-user_id", "fields": "user_id", "limit": SORT_PAGE_LIMIT}
+    for _ in range(-(-total // SORT_PAGE_LIMIT) + 1):
+        response = await ac.get("/users/", params=params, headers=headers)
+        assert response.status_code == 200
+        result = response.json().get("result")
+        ids += [user.get("user_id") for user in result.get("users")]
+        if result.get("next_cursor") is None:
+            break
+        params = {**params, "cursor": result.get("next_cursor")}
+    else:
+        pytest.fail("/users/ still had a next_cursor after every user was listed")
+    assert len(ids) == total
+    assert ids == sorted(ids, reverse=True)
+    assert len(set(ids)) == len(ids)
+
+
+async def test_sort_users_email(ac: AsyncClient, fields):
+    headers = fields["owner"]["headers"]
+    response = await ac.get("/users/", params={"sort": "user_email", "limit": 100}, headers=headers)
+    assert response.status_code == 200
+    emails = [user.get("user_email") for user in response.json().get("result").get("users")]
+    assert emails == sorted(emails)
+
+
+async def test_sort_users_bad(ac: AsyncClient, fields):
+    headers = fields["owner"]["headers"]
+    for sort in ("user_password", "no_such_field"):
+        response = await ac.get("/users/", params={"sort": sort}, headers=headers)
+        assert response.status_code == 422
+
+
+async def test_fields_companies_owner(ac: AsyncClient, fields):
+    headers = fields["other"]["headers"]
+    params = {
+        "owner_id": fields["owner"]["user_id"],
+        "fields": "company_id,company_name",
+    }
+    response = await ac.get("/companies/", params=params, headers=headers)
+    assert response.status_code == 200
+    companies = response.json().get("result").get("companies")
+    assert companies == fields["companies"]
+
+
+async def test_fields_companies_owner_sorted(ac: AsyncClient, fields):
+    headers = fields["other"]["headers"]
+    params = {
+        "owner_id": fields["owner"]["user_id"],
+        "sort": "-company_id",
+    }
+    response = await ac.get("/companies/", params=params, headers=headers)
+    assert response.status_code == 200
+    companies = response.json().get("result").get("companies")
+    assert [company.get("company_id") for company in companies] == [
+        company.get("company_id") for company in reversed(fields["companies"])
+    ]
+    assert companies[0].get("company_owner_id") == fields["owner"]["user_id"]
+    assert companies[0].get("company_description").startswith("large description")
+
+
+async def test_fields_companies_owner_none(ac: AsyncClient, fields):
+    headers = fields["owner"]["headers"]
+    response = await ac.get("/companies/", params={"owner_id": fields["other"]["user_id"]}, headers=headers)
+    assert response.status_code == 200
+    assert response.json().get("result").get("companies") == []
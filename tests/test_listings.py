@@ -0,0 +1,256 @@
+import asyncio
+import json
+import tracemalloc
+
+import pytest
+
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.main import app
+from tests.seed import copy_companies, copy_users
+
+
+SEED_USERS = 3000
+SEED_COMPANIES = 2000
+PAGE_LIMIT = 250
+EXPORT_MEMORY_LIMIT = 8 * 1024 * 1024
+
+
+@pytest.fixture(scope='module')
+async def lister(user_factory, company_factory) -> dict:
+    # a few rows of our own, so the small page tests have more than one page
+    owner = await user_factory("listing")
+    for _ in range(2):
+        await user_factory("listing")
+        await company_factory(owner, "listing")
+    return owner
+
+
+async def count_rows(db, table) -> int:
+    return await db.fetch_val(select(func.count()).select_from(table))
+
+
+@pytest.fixture(scope='module')
+async def seeded_users(db, users_table, raw_connection, lister):
+    # totals include whatever the chain or this module already put in the shared schema
+    await copy_users(raw_connection, "seed", SEED_USERS)
+    yield await count_rows(db, users_table)
+    await db.execute(users_table.delete().where(users_table.c.user_email.like("seed_%")))
+
+
+@pytest.fixture(scope='module')
+async def seeded_companies(db, companies_table, raw_connection, lister):
+    await copy_companies(raw_connection, "seed", SEED_COMPANIES, lister["user_id"])
+    yield await count_rows(db, companies_table)
+    await db.execute(companies_table.delete().where(companies_table.c.company_name.like("seed_company_%")))
+
+
+async def walk_pages(ac: AsyncClient, url: str, key: str, headers: dict, total: int, limit: int = PAGE_LIMIT):
+    # a cursor that never runs out must fail the test, one spare page allows for an empty last page
+    items = []
+    params = {"limit": limit}
+    max_pages = -(-total // limit) + 1
+    for pages in range(1, max_pages + 1):
+        response = await ac.get(url, params=params, headers=headers)
+        assert response.status_code == 200
+        result = response.json().get("result")
+        assert len(result.get(key)) <= limit
+        items.extend(result.get(key))
+        if result.get("next_cursor") is None:
+            return items, pages
+        params = {"limit": limit, "cursor": result.get("next_cursor")}
+    pytest.fail(f"{url} still had a next_cursor after {max_pages} pages")
+
+
+async def stream_export(path: str, headers: dict) -> dict:
+    # drive the ASGI app directly, httpx AsyncClient buffers the whole body before returning
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(key.lower().encode(), value.encode()) for key, value in headers.items()],
+        "server": ("test", 80),
+        "client": ("127.0.0.1", 5000),
+    }
+    stats = {"status": None, "headers": {}, "chunks": 0, "lines": 0}
+    request_sent = False
+    response_complete = asyncio.Event()
+
+    async def receive():
+        # like httpx's ASGITransport, only report a disconnect once the whole body is out,
+        # StreamingResponse listens for it while streaming and would stop early otherwise
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            stats["status"] = message["status"]
+            stats["headers"] = {key.decode(): value.decode() for key, value in message["headers"]}
+        elif message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            if body:
+                stats["chunks"] += 1
+                stats["lines"] += body.count(b"\n")
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    try:
+        await app(scope, receive, send)
+    finally:
+        response_complete.set()
+    return stats
+
+
+async def measure_export(path: str, headers: dict) -> tuple:
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        stats = await stream_export(path, headers)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return stats, peak
+
+
+# users pagination
+
+async def test_users_first_page(ac: AsyncClient, lister):
+    headers = lister["headers"]
+    response = await ac.get("/users/", params={"limit": 2}, headers=headers)
+    assert response.status_code == 200
+    assert len(response.json().get("result").get("users")) == 2
+    assert response.json().get("result").get("next_cursor") is not None
+
+
+async def test_users_last_page_no_cursor(ac: AsyncClient, db, users_table, lister):
+    headers = lister["headers"]
+    total = await count_rows(db, users_table)
+    users, _ = await walk_pages(ac, "/users/", "users", headers, total, limit=100)
+    assert len(users) == total
+
+
+async def test_users_bad_limit(ac: AsyncClient, lister):
+    headers = lister["headers"]
+    response = await ac.get("/users/", params={"limit": 0}, headers=headers)
+    assert response.status_code == 422
+
+
+async def test_users_bad_cursor(ac: AsyncClient, lister):
+    headers = lister["headers"]
+    response = await ac.get("/users/", params={"cursor": "not_a_cursor"}, headers=headers)
+    assert response.status_code == 400
+
+
+async def test_users_walk_all_pages(ac: AsyncClient, lister, seeded_users):
+    headers = lister["headers"]
+    users, pages = await walk_pages(ac, "/users/", "users", headers, seeded_users)
+    ids = [user.get("user_id") for user in users]
+    assert len(ids) == seeded_users
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+    assert pages == -(-len(ids) // PAGE_LIMIT)
+    assert all(user.get("user_password") is None for user in users)
+
+
+async def test_users_cursor_is_stable(ac: AsyncClient, lister, seeded_users):
+    headers = lister["headers"]
+    first = await ac.get("/users/", params={"limit": PAGE_LIMIT}, headers=headers)
+    cursor = first.json().get("result").get("next_cursor")
+    second_one = await ac.get("/users/", params={"limit": PAGE_LIMIT, "cursor": cursor}, headers=headers)
+    second_two = await ac.get("/users/", params={"limit": PAGE_LIMIT, "cursor": cursor}, headers=headers)
+    assert second_one.status_code == 200
+    assert second_one.json() == second_two.json()
+    last_id = first.json().get("result").get("users")[-1].get("user_id")
+    assert second_one.json().get("result").get("users")[0].get("user_id") > last_id
+
+
+# companies pagination
+
+async def test_companies_first_page(ac: AsyncClient, lister):
+    headers = lister["headers"]
+    response = await ac.get("/companies/", params={"limit": 1}, headers=headers)
+    assert response.status_code == 200
+    assert len(response.json().get("result").get("companies")) == 1
+    assert response.json().get("result").get("next_cursor") is not None
+
+
+async def test_companies_bad_cursor(ac: AsyncClient, lister):
+    headers = lister["headers"]
+    response = await ac.get("/companies/", params={"cursor": "not_a_cursor"}, headers=headers)
+    assert response.status_code == 400
+
+
+async def test_companies_walk_all_pages(ac: AsyncClient, lister, seeded_companies):
+    headers = lister["headers"]
+    companies, pages = await walk_pages(ac, "/companies/", "companies", headers, seeded_companies)
+    ids = [company.get("company_id") for company in companies]
+    assert len(ids) == seeded_companies
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+    assert pages == -(-len(ids) // PAGE_LIMIT)
+
+
+# users export
+
+async def test_users_export_unauth(ac: AsyncClient):
+    response = await ac.get("/users/export")
+    assert response.status_code == 403
+
+
+async def test_users_export(ac: AsyncClient, lister, seeded_users):
+    headers = lister["headers"]
+    response = await ac.get("/users/export", headers=headers)
+    assert response.status_code == 200
+    assert response.headers.get("content-type").startswith("application/x-ndjson")
+    users = [json.loads(line) for line in response.text.splitlines()]
+    ids = [user.get("user_id") for user in users]
+    assert len(ids) == seeded_users
+    assert len(set(ids)) == len(ids)
+    assert all(user.get("user_password") is None for user in users)
+    assert ids == sorted(ids)
+
+
+async def test_companies_export_unauth(ac: AsyncClient):
+    response = await ac.get("/companies/export")
+    assert response.status_code == 403
+
+
+async def test_companies_export(ac: AsyncClient, lister, seeded_companies):
+    headers = lister["headers"]
+    response = await ac.get("/companies/export", headers=headers)
+    assert response.status_code == 200
+    assert response.headers.get("content-type").startswith("application/x-ndjson")
+    companies = [json.loads(line) for line in response.text.splitlines()]
+    ids = [company.get("company_id") for company in companies]
+    assert len(ids) == seeded_companies
+    assert len(set(ids)) == len(ids)
+
+
+async def test_users_export_memory_is_flat(db, users_table, raw_connection, lister, seeded_users):
+    headers = lister["headers"]
+    try:
+        await copy_users(raw_connection, "export", 10_000)
+        small_stats, small_peak = await measure_export("/users/export", headers)
+        await copy_users(raw_connection, "export", 90_000, start=10_000)
+        big_stats, big_peak = await measure_export("/users/export", headers)
+    finally:
+        await db.execute(users_table.delete().where(users_table.c.user_email.like("export_%")))
+
+    assert small_stats["status"] == 200
+    assert big_stats["status"] == 200
+    assert small_stats["lines"] == seeded_users + 10_000
+    assert big_stats["lines"] == seeded_users + 100_000
+    assert big_stats["chunks"] > 1
+    assert big_peak < EXPORT_MEMORY_LIMIT
+    assert big_peak < small_peak * 2
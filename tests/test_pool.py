@@ -0,0 +1,98 @@
+import asyncio
+import time
+
+import pytest
+
+from core.config import system_config
+from core.connections import make_db, pool_stats
+
+
+POOL_SIZE = 2
+POOL_CALLERS = 10
+QUERY_SECONDS = 0.2
+POOL_MAX_LIFETIME = 123
+POOL_STATEMENT_CACHE = 7
+
+
+@pytest.fixture
+async def small_pool(db_url, monkeypatch):
+    monkeypatch.setattr(system_config, "db_pool_min_size", 1)
+    monkeypatch.setattr(system_config, "db_pool_max_size", POOL_SIZE)
+    monkeypatch.setattr(system_config, "db_pool_acquire_timeout", 30)
+    monkeypatch.setattr(system_config, "db_pool_max_lifetime", POOL_MAX_LIFETIME)
+    monkeypatch.setattr(system_config, "db_statement_cache_size", POOL_STATEMENT_CACHE)
+    pool_db = make_db(db_url)
+    await pool_db.connect()
+    yield pool_db
+    await pool_db.disconnect()
+
+
+def test_pool_config_fields():
+    assert system_config.db_pool_min_size <= system_config.db_pool_max_size
+    assert system_config.db_pool_acquire_timeout > 0
+    assert system_config.db_pool_max_lifetime > 0
+    assert system_config.db_statement_cache_size >= 0
+
+
+async def test_pool_stats_idle(small_pool):
+    stats = pool_stats(small_pool)
+    assert stats.get("in_use") == 0
+    assert stats.get("waiters") == 0
+    assert 1 <= stats.get("idle") <= POOL_SIZE
+    assert stats.get("max_size") == POOL_SIZE
+    assert stats.get("max_lifetime") == POOL_MAX_LIFETIME
+    assert stats.get("statement_cache_size") == POOL_STATEMENT_CACHE
+
+
+async def test_pool_saturated_callers_queue(small_pool):
+    peak = {"in_use": 0, "waiters": 0}
+
+    async def watch():
+        while True:
+            stats = pool_stats(small_pool)
+            peak["in_use"] = max(peak["in_use"], stats.get("in_use"))
+            peak["waiters"] = max(peak["waiters"], stats.get("waiters"))
+            await asyncio.sleep(0.01)
+
+    async def caller():
+        async with small_pool.connection() as connection:
+            return await connection.fetch_val(f"SELECT pg_sleep({QUERY_SECONDS}) IS NULL")
+
+    watcher = asyncio.create_task(watch())
+    start = time.perf_counter()
+    results = await asyncio.gather(*(caller() for _ in range(POOL_CALLERS)))
+    elapsed = time.perf_counter() - start
+    watcher.cancel()
+
+    assert results == [True] * POOL_CALLERS
+    assert elapsed >= QUERY_SECONDS * POOL_CALLERS / POOL_SIZE * 0.9
+    assert peak["in_use"] == POOL_SIZE
+    assert peak["waiters"] > 0
+
+    stats = pool_stats(small_pool)
+    assert stats.get("in_use") == 0
+    assert stats.get("waiters") == 0
+    histogram = stats.get("acquire_latency")
+    assert sum(histogram.get("counts")) >= POOL_CALLERS
+    assert len(histogram.get("counts")) == len(histogram.get("buckets")) + 1
+
+
+async def test_pool_acquire_timeout(db_url, monkeypatch):
+    monkeypatch.setattr(system_config, "db_pool_min_size", 1)
+    monkeypatch.setattr(system_config, "db_pool_max_size", 1)
+    monkeypatch.setattr(system_config, "db_pool_acquire_timeout", 0.1)
+    tight_db = make_db(db_url)
+    await tight_db.connect()
+    try:
+        async def hold():
+            async with tight_db.connection() as connection:
+                await connection.execute(f"SELECT pg_sleep({QUERY_SECONDS * 2})")
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(QUERY_SECONDS / 2)
+        with pytest.raises(asyncio.TimeoutError):
+            async with tight_db.connection() as connection:
+                await connection.execute("SELECT 1")
+        await holder
+    finally:
+        await tight_db.disconnect()
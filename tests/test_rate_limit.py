@@ -0,0 +1,200 @@
+import pytest
+
+from httpx import AsyncClient, ASGITransport
+from databases import Database
+
+from app.main import app
+from core.config import system_config
+from core.connections import get_db
+from core.rate_limit import MemoryBackend, rate_limiter
+
+
+LOGIN_LIMIT = 3
+ACCOUNT_LIMIT = 5
+SIGNUP_LIMIT = 2
+IP_LIMIT = 10
+REFILL_PER_SECOND = 1
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class RecordingBackend(MemoryBackend):
+    # same buckets as the in-memory backend, remembers which keys were charged
+    def __init__(self):
+        super().__init__()
+        self.keys = []
+
+    async def take(self, key: str, capacity: int, refill_per_second: float, now: float) -> float:
+        self.keys.append(key)
+        return await super().take(key, capacity, refill_per_second, now)
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake_clock = FakeClock()
+    monkeypatch.setattr(system_config, "rate_limit_enabled", True)
+    monkeypatch.setattr(system_config, "rate_limits", {
+        "ip": {"capacity": IP_LIMIT, "refill_per_second": REFILL_PER_SECOND},
+        "account": {"capacity": ACCOUNT_LIMIT, "refill_per_second": REFILL_PER_SECOND},
+        "POST /auth/login/": {"capacity": LOGIN_LIMIT, "refill_per_second": REFILL_PER_SECOND},
+        "POST /user/": {"capacity": SIGNUP_LIMIT, "refill_per_second": REFILL_PER_SECOND},
+    })
+    monkeypatch.setattr(rate_limiter, "clock", fake_clock)
+    monkeypatch.setattr(rate_limiter, "backend", MemoryBackend())
+    return fake_clock
+
+
+@pytest.fixture
+async def client_from():
+    clients = []
+
+    async def __client(ip: str) -> AsyncClient:
+        client = AsyncClient(transport=ASGITransport(app=app, client=(ip, 4000)), base_url="http://test")
+        clients.append(client)
+        return client
+
+    yield __client
+    for client in clients:
+        await client.aclose()
+
+
+async def bad_login(client: AsyncClient, user_email: str):
+    payload = {
+        "user_email": user_email,
+        "user_password": "wrong_password",
+    }
+    return await client.post("/auth/login/", json=payload)
+
+
+def assert_limited(response):
+    assert response.status_code == 429
+    assert response.json().get("detail") == "Too many requests"
+    assert int(response.headers.get("retry-after")) >= 1
+
+
+def test_rate_limit_config_fields():
+    assert isinstance(system_config.rate_limit_enabled, bool)
+    for limit in system_config.rate_limits.values():
+        assert limit["capacity"] > 0
+        assert limit["refill_per_second"] > 0
+
+
+async def test_rate_limit_login_route(clock, client_from):
+    client = await client_from("10.0.0.1")
+    for i in range(LOGIN_LIMIT):
+        response = await bad_login(client, f"nobody{i}@rate.com")
+        assert response.status_code == 401
+    assert_limited(await bad_login(client, "nobody@rate.com"))
+
+    clock.advance(1 / REFILL_PER_SECOND)
+    response = await bad_login(client, "nobody@rate.com")
+    assert response.status_code == 401
+    assert_limited(await bad_login(client, "nobody@rate.com"))
+
+
+async def test_rate_limit_ips_separate(clock, client_from):
+    first = await client_from("10.0.0.1")
+    second = await client_from("10.0.0.2")
+    for i in range(LOGIN_LIMIT):
+        await bad_login(first, f"nobody{i}@rate.com")
+    assert_limited(await bad_login(first, "nobody@rate.com"))
+    response = await bad_login(second, "nobody@rate.com")
+    assert response.status_code == 401
+
+
+async def test_rate_limit_account_across_ips(clock, client_from):
+    # credential stuffing spreads one account over many addresses
+    for i in range(ACCOUNT_LIMIT):
+        client = await client_from(f"10.0.1.{i}")
+        response = await bad_login(client, "victim@rate.com")
+        assert response.status_code == 401
+    client = await client_from("10.0.1.250")
+    assert_limited(await bad_login(client, "victim@rate.com"))
+    assert_limited(await bad_login(client, "VICTIM@rate.com"))
+    response = await bad_login(client, "other@rate.com")
+    assert response.status_code == 401
+
+
+async def test_rate_limit_signup_route(clock, client_from, isolated):
+    client = await client_from("10.0.2.1")
+    for i in range(SIGNUP_LIMIT):
+        payload = {
+            "user_password": "rate",
+            "user_password_repeat": "rate",
+            "user_email": f"rate_signup{i}@test.com",
+            "user_name": f"rate_signup{i}",
+        }
+        response = await client.post("/user/", json=payload)
+        assert response.status_code == 200
+    assert_limited(await client.post("/user/", json=payload))
+
+
+async def test_rate_limit_ip_all_routes(clock, client_from):
+    client = await client_from("10.0.3.1")
+    for _ in range(IP_LIMIT):
+        response = await client.get("/users/")
+        assert response.status_code == 403
+    assert_limited(await client.get("/users/"))
+    assert_limited(await client.get("/invite/my"))
+
+
+async def test_rate_limit_rejects_before_db(clock, client_from, monkeypatch):
+    client = await client_from("10.0.4.1")
+    for i in range(LOGIN_LIMIT):
+        await bad_login(client, f"nobody{i}@rate.com")
+    # nothing behind the limiter may run, so an unreachable database can't change the answer
+    monkeypatch.setitem(app.dependency_overrides, get_db, lambda: Database("postgresql://nobody@127.0.0.1:1/none"))
+    assert_limited(await bad_login(client, "nobody@rate.com"))
+
+
+async def test_rate_limit_retry_after(clock, client_from):
+    client = await client_from("10.0.5.1")
+    for i in range(LOGIN_LIMIT):
+        await bad_login(client, f"nobody{i}@rate.com")
+    response = await bad_login(client, "nobody@rate.com")
+    assert_limited(response)
+    clock.advance(int(response.headers.get("retry-after")))
+    response = await bad_login(client, "nobody@rate.com")
+    assert response.status_code == 401
+
+
+async def test_rate_limit_disabled(clock, client_from, monkeypatch):
+    monkeypatch.setattr(system_config, "rate_limit_enabled", False)
+    client = await client_from("10.0.6.1")
+    for i in range(LOGIN_LIMIT * 2):
+        response = await bad_login(client, f"nobody{i}@rate.com")
+        assert response.status_code == 401
+
+
+async def test_rate_limit_pluggable_backend(clock, client_from, monkeypatch):
+    backend = RecordingBackend()
+    monkeypatch.setattr(rate_limiter, "backend", backend)
+    client = await client_from("10.0.7.1")
+    response = await bad_login(client, "plug@rate.com")
+    assert response.status_code == 401
+    assert len(backend.keys) == 3
+    assert any("10.0.7.1" in key for key in backend.keys)
+    assert any("plug@rate.com" in key for key in backend.keys)
+    assert any("POST /auth/login/" in key for key in backend.keys)
+
+
+async def test_rate_limit_memory_backend_refill():
+    backend = MemoryBackend()
+    assert await backend.take("bucket", 2, 1, now=0) == 0
+    assert await backend.take("bucket", 2, 1, now=0) == 0
+    assert await backend.take("bucket", 2, 1, now=0) > 0
+    assert await backend.take("bucket", 2, 1, now=0.5) > 0
+    assert await backend.take("bucket", 2, 1, now=1) == 0
+    # refill never goes above capacity
+    assert await backend.take("bucket", 2, 1, now=100) == 0
+    assert await backend.take("bucket", 2, 1, now=100) == 0
+    assert await backend.take("bucket", 2, 1, now=100) > 0
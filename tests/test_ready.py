@@ -0,0 +1,127 @@
+import time
+
+import pytest
+
+from contextlib import asynccontextmanager
+
+from httpx import AsyncClient
+from databases import Database
+
+from app.main import app
+from core.config import system_config
+from core.connections import get_db, make_db, pool_stats
+
+
+STALL_SECONDS = 5
+
+
+class BrokenDatabase:
+    # a real pool whose queries misbehave, pool attributes and stats come from the pool underneath
+    def __init__(self, db: Database):
+        self.db = db
+
+    def __getattr__(self, name: str):
+        return getattr(self.db, name)
+
+    async def query(self):
+        raise NotImplementedError
+
+    async def fetch_val(self, *args, **kwargs):
+        return await self.query()
+
+    async def fetch_one(self, *args, **kwargs):
+        return await self.query()
+
+    async def execute(self, *args, **kwargs):
+        return await self.query()
+
+    @asynccontextmanager
+    async def connection(self):
+        await self.query()
+        async with self.db.connection() as connection:
+            yield connection
+
+
+class SlowDatabase(BrokenDatabase):
+    # every query stalls in pg_sleep long after the readiness timeout
+    async def query(self):
+        return await self.db.fetch_val(f"SELECT pg_sleep({STALL_SECONDS}) IS NULL")
+
+
+class UnreachableDatabase(BrokenDatabase):
+    # every query fails the way a refused connection does
+    async def query(self):
+        raise ConnectionRefusedError("database is unreachable")
+
+
+@pytest.fixture
+async def pool_db(db_url):
+    # its own pool, a cancelled pg_sleep on the shared rollback session would abort its transaction
+    pool_db = make_db(db_url)
+    await pool_db.connect()
+    yield pool_db
+    await pool_db.disconnect()
+
+
+@pytest.fixture
+def slow_db(pool_db) -> SlowDatabase:
+    return SlowDatabase(pool_db)
+
+
+@pytest.fixture
+def unreachable_db(pool_db) -> UnreachableDatabase:
+    return UnreachableDatabase(pool_db)
+
+
+async def test_ready_ok(ac: AsyncClient, monkeypatch):
+    monkeypatch.setattr(system_config, "ready_cache_seconds", 0)
+    response = await ac.get("/ready")
+    assert response.status_code == 200
+    assert response.json().get("detail") == "ok"
+    result = response.json().get("result")
+    assert result.get("database") == "ok"
+    assert 0 <= result.get("pool").get("in_use") <= result.get("pool").get("max_size")
+
+
+async def test_ready_cached(ac: AsyncClient, unreachable_db, monkeypatch):
+    monkeypatch.setattr(system_config, "ready_cache_seconds", 60)
+    response = await ac.get("/ready")
+    assert response.status_code == 200
+    monkeypatch.setitem(app.dependency_overrides, get_db, lambda: unreachable_db)
+    response = await ac.get("/ready")
+    assert response.status_code == 200
+
+
+async def test_ready_db_unreachable(ac: AsyncClient, unreachable_db, monkeypatch):
+    monkeypatch.setattr(system_config, "ready_cache_seconds", 0)
+    monkeypatch.setitem(app.dependency_overrides, get_db, lambda: unreachable_db)
+    response = await ac.get("/ready")
+    assert response.status_code == 503
+    assert response.json().get("result").get("database") != "ok"
+
+
+async def test_ready_db_timeout(ac: AsyncClient, slow_db, monkeypatch):
+    monkeypatch.setattr(system_config, "ready_cache_seconds", 0)
+    monkeypatch.setattr(system_config, "ready_timeout", 0.2)
+    monkeypatch.setitem(app.dependency_overrides, get_db, lambda: slow_db)
+    start = time.perf_counter()
+    response = await ac.get("/ready")
+    assert time.perf_counter() - start < 1
+    assert response.status_code == 503
+    assert response.json().get("result").get("database") == "timeout"
+    assert response.json().get("result").get("pool").get("max_size") == pool_stats(slow_db.db).get("max_size")
+
+
+async def test_ready_pool_saturated(ac: AsyncClient, monkeypatch):
+    monkeypatch.setattr(system_config, "ready_cache_seconds", 0)
+    monkeypatch.setattr(system_config, "ready_pool_saturation", -1)
+    response = await ac.get("/ready")
+    assert response.status_code == 503
+    assert response.json().get("result").get("database") == "ok"
+
+
+async def test_liveness_unchanged(ac: AsyncClient, unreachable_db, monkeypatch):
+    monkeypatch.setitem(app.dependency_overrides, get_db, lambda: unreachable_db)
+    response = await ac.get("/")
+    assert response.status_code == 200
+    assert response.json().get("result") == "working"
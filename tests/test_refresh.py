@@ -0,0 +1,137 @@
+import asyncio
+
+from httpx import AsyncClient
+
+from core.config import system_config
+
+
+ACCESS_TOKEN_SECONDS = 1
+
+
+async def login(ac: AsyncClient, user: dict) -> dict:
+    payload = {
+        "user_email": user["user_email"],
+        "user_password": user["user_name"],
+    }
+    response = await ac.post("/auth/login/", json=payload)
+    assert response.status_code == 200
+    return response.json().get("result")
+
+
+async def refresh(ac: AsyncClient, refresh_token: str):
+    return await ac.post("/auth/refresh/", json={"refresh_token": refresh_token})
+
+
+def bearer(tokens: dict) -> dict:
+    return {"Authorization": f"Bearer {tokens.get('access_token')}"}
+
+
+def test_refresh_config_fields():
+    assert 0 < system_config.access_token_expire_seconds < system_config.refresh_token_expire_seconds
+
+
+async def test_refresh_login_pair(ac: AsyncClient, isolated, user_factory):
+    user = await user_factory("refresh")
+    tokens = await login(ac, user)
+    assert tokens.get("token_type") == "Bearer"
+    assert tokens.get("access_token")
+    assert tokens.get("refresh_token")
+    assert tokens.get("access_token") != tokens.get("refresh_token")
+    assert tokens.get("expires_in") == system_config.access_token_expire_seconds
+
+
+async def test_refresh_rotates(ac: AsyncClient, isolated, user_factory):
+    user = await user_factory("refresh")
+    tokens = await login(ac, user)
+    response = await refresh(ac, tokens.get("refresh_token"))
+    assert response.status_code == 200
+    rotated = response.json().get("result")
+    assert rotated.get("token_type") == "Bearer"
+    assert rotated.get("refresh_token") != tokens.get("refresh_token")
+    assert rotated.get("access_token") != tokens.get("access_token")
+    response = await ac.get("/auth/me/", headers=bearer(rotated))
+    assert response.status_code == 200
+    assert response.json().get("result").get("user_id") == user["user_id"]
+
+    response = await refresh(ac, rotated.get("refresh_token"))
+    assert response.status_code == 200
+
+
+async def test_refresh_reuse_revokes_family(ac: AsyncClient, isolated, user_factory):
+    user = await user_factory("refresh")
+    tokens = await login(ac, user)
+    response = await refresh(ac, tokens.get("refresh_token"))
+    assert response.status_code == 200
+    rotated = response.json().get("result")
+
+    # replaying a rotated token means it leaked, so the whole chain it started is cut
+    response = await refresh(ac, tokens.get("refresh_token"))
+    assert response.status_code == 401
+    response = await refresh(ac, rotated.get("refresh_token"))
+    assert response.status_code == 401
+    response = await ac.get("/auth/me/", headers=bearer(rotated))
+    assert response.status_code == 401
+
+    # other sessions of the same user keep working
+    response = await ac.get("/auth/me/", headers=user["headers"])
+    assert response.status_code == 200
+
+
+async def test_refresh_after_access_expired(ac: AsyncClient, isolated, user_factory, monkeypatch):
+    monkeypatch.setattr(system_config, "access_token_expire_seconds", ACCESS_TOKEN_SECONDS)
+    user = await user_factory("refresh")
+    tokens = await login(ac, user)
+    await asyncio.sleep(ACCESS_TOKEN_SECONDS + 1)
+    response = await ac.get("/auth/me/", headers=bearer(tokens))
+    assert response.status_code == 401
+    response = await refresh(ac, tokens.get("refresh_token"))
+    assert response.status_code == 200
+    response = await ac.get("/auth/me/", headers=bearer(response.json().get("result")))
+    assert response.status_code == 200
+
+
+async def test_refresh_skips_password_check(ac: AsyncClient, isolated, user_factory, db, users_table, monkeypatch):
+    # a changed cost makes every password verification rehash, a refresh must leave the hash alone
+    user = await user_factory("refresh")
+    tokens = await login(ac, user)
+    query = users_table.select().where(users_table.c.user_email == user["user_email"])
+    before = await db.fetch_val(query, column=users_table.c.user_password)
+    rounds = system_config.password_hash_rounds
+    monkeypatch.setattr(system_config, "password_hash_rounds", 5 if rounds == 4 else 4)
+    response = await refresh(ac, tokens.get("refresh_token"))
+    assert response.status_code == 200
+    assert await db.fetch_val(query, column=users_table.c.user_password) == before
+
+
+async def test_refresh_token_types_not_interchangeable(ac: AsyncClient, isolated, user_factory):
+    user = await user_factory("refresh")
+    tokens = await login(ac, user)
+    response = await refresh(ac, tokens.get("access_token"))
+    assert response.status_code == 401
+    response = await ac.get("/auth/me/", headers={"Authorization": f"Bearer {tokens.get('refresh_token')}"})
+    assert response.status_code == 401
+
+
+async def test_refresh_bad_token(ac: AsyncClient):
+    response = await refresh(ac, "not.a.token")
+    assert response.status_code == 401
+    response = await ac.post("/auth/refresh/", json={})
+    assert response.status_code == 422
+
+
+async def test_refresh_after_logout_all(ac: AsyncClient, isolated, user_factory):
+    user = await user_factory("refresh")
+    tokens = await login(ac, user)
+    response = await ac.post("/auth/logout/all/", headers=user["headers"])
+    assert response.status_code == 200
+    response = await refresh(ac, tokens.get("refresh_token"))
+    assert response.status_code == 401
+
+
+async def test_refresh_deleted_user(ac: AsyncClient, isolated, user_factory):
+    user = await user_factory("refresh")
+    tokens = await login(ac, user)
+    response = await ac.delete(f"/user/{user['user_id']}/", headers=user["headers"])
+    assert response.status_code == 200
+    response = await refresh(ac, tokens.get("refresh_token"))
+    assert response.status_code == 401
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from httpx import AsyncClient
+from databases import Database
+
+from core import connections
+from core.config import system_config
+
+
+STICKY_SECONDS = 0.5
+
+
+@pytest.fixture
+async def replica(db_url, monkeypatch):
+    # a second connection without force_rollback only sees committed rows, i.e. an empty schema,
+    # so anything routed to it is easy to tell apart from the primary. get_replica_db itself is
+    # left in place, it owns the choice between a replica and the sticky primary
+    replica_db = Database(db_url)
+    await replica_db.connect()
+    monkeypatch.setattr(system_config, "db_replica_urls", [db_url])
+    monkeypatch.setattr(system_config, "db_sticky_seconds", STICKY_SECONDS)
+    monkeypatch.setattr(connections, "replica_dbs", [replica_db])
+    yield replica_db
+    await replica_db.disconnect()
+
+
+@pytest.fixture(scope='module')
+async def readers(user_factory, company_factory) -> dict:
+    # the writer's company is only on the primary, readers start without companies of their own
+    writer = await user_factory("replica_writer")
+    await company_factory(writer, "replica_primary")
+    return {"first": await user_factory("replica"), "second": await user_factory("replica")}
+
+
+async def list_companies(ac: AsyncClient, user: dict) -> list:
+    response = await ac.get("/companies/", headers=user["headers"])
+    assert response.status_code == 200
+    return response.json().get("result").get("companies")
+
+
+async def test_replica_no_replicas_reads_primary(ac: AsyncClient, readers, monkeypatch):
+    monkeypatch.setattr(system_config, "db_replica_urls", [])
+    monkeypatch.setattr(connections, "replica_dbs", [])
+    assert len(await list_companies(ac, readers["first"])) > 0
+
+
+async def test_replica_reads_routed(ac: AsyncClient, readers, replica):
+    assert await list_companies(ac, readers["first"]) == []
+
+
+async def test_replica_auth_uses_primary(ac: AsyncClient, readers, replica):
+    response = await ac.get("/auth/me/", headers=readers["first"]["headers"])
+    assert response.status_code == 200
+    assert response.json().get('result').get('user_email') == readers["first"]["user_email"]
+
+
+async def test_replica_read_your_writes(ac: AsyncClient, readers, replica, company_factory):
+    company_id = await company_factory(readers["first"], "replica")
+
+    companies = await list_companies(ac, readers["first"])
+    assert company_id in [company.get("company_id") for company in companies]
+    assert await list_companies(ac, readers["second"]) == []
+
+    await asyncio.sleep(STICKY_SECONDS * 1.5)
+    assert await list_companies(ac, readers["first"]) == []
@@ -0,0 +1,49 @@
+import json
+
+from httpx import AsyncClient
+from starlette.responses import JSONResponse
+
+import core.responses
+from app.main import app
+from core.responses import FastJSONResponse
+
+
+ENVELOPE = {
+    "status_code": 200,
+    "detail": "success",
+    "result": {
+        "users": [
+            {"user_id": 1, "user_name": "test1", "user_email": "test1@test.com", "user_password": None},
+            {"user_id": 2, "user_name": "тест2", "user_email": "test2@test.com", "user_password": None},
+        ],
+        "next_cursor": None,
+    },
+}
+
+
+def test_fast_json_app_wide():
+    assert app.router.default_response_class is FastJSONResponse
+
+
+def test_fast_json_same_payload():
+    fast = FastJSONResponse(ENVELOPE)
+    default = JSONResponse(ENVELOPE)
+    assert json.loads(fast.body) == json.loads(default.body)
+    assert fast.headers.get("content-type") == "application/json"
+
+
+def test_fast_json_fallback(monkeypatch):
+    monkeypatch.setattr(core.responses, "orjson", None)
+    response = FastJSONResponse(ENVELOPE)
+    assert json.loads(response.body) == ENVELOPE
+
+
+async def test_fast_json_endpoint(ac: AsyncClient):
+    response = await ac.get("/")
+    assert response.status_code == 200
+    assert response.headers.get("content-type") == "application/json"
+    assert response.json() == {
+        "status_code": 200,
+        "detail": "ok",
+        "result": "working"
+    }
@@ -0,0 +1,143 @@
+import asyncio
+import base64
+import json
+import time
+import uuid
+
+import pytest
+
+from httpx import AsyncClient
+
+from core.config import system_config
+from core.revocation import RevocationList, revocation_list
+from tests.conftest import CountingDatabase
+
+
+FAST_PATH_PROBES = 10_000
+FAST_PATH_LIMIT = 0.00005
+FALSE_POSITIVE_SLACK = 3
+FALSE_POSITIVE_FLOOR = 10
+CUT_OFF_PRECISION = 1
+
+
+def token_jti(token: str) -> str:
+    payload = token.split(".")[1]
+    return json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))).get("jti")
+
+
+async def login(ac: AsyncClient, user: dict) -> dict:
+    payload = {
+        "user_email": user["user_email"],
+        "user_password": user["user_name"],
+    }
+    response = await ac.post("/auth/login/", json=payload)
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json().get('result').get('access_token')}"}
+
+
+def test_revocation_config_fields():
+    assert system_config.revocation_refresh_seconds > 0
+    assert 0 < system_config.revocation_false_positive_rate < 1
+
+
+async def test_revocation_tokens_have_jti(ac: AsyncClient, isolated, user_factory):
+    user = await user_factory("revoke")
+    other_headers = await login(ac, user)
+    first = token_jti(user["headers"]["Authorization"].split()[1])
+    second = token_jti(other_headers["Authorization"].split()[1])
+    assert first and second
+    assert first != second
+
+
+async def test_revocation_logout_unauth(ac: AsyncClient):
+    response = await ac.post("/auth/logout/")
+    assert response.status_code == 403
+    response = await ac.post("/auth/logout/all/")
+    assert response.status_code == 403
+
+
+async def test_revocation_logout(ac: AsyncClient, isolated, user_factory):
+    user = await user_factory("revoke")
+    other_headers = await login(ac, user)
+    response = await ac.post("/auth/logout/", headers=user["headers"])
+    assert response.status_code == 200
+    for url in ("/auth/me/", "/users/", "/invite/my"):
+        response = await ac.get(url, headers=user["headers"])
+        assert response.status_code == 401
+    response = await ac.post("/auth/logout/", headers=user["headers"])
+    assert response.status_code == 401
+
+    # only the presented token is revoked
+    response = await ac.get("/auth/me/", headers=other_headers)
+    assert response.status_code == 200
+
+
+async def test_revocation_logout_all(ac: AsyncClient, isolated, user_factory):
+    user = await user_factory("revoke")
+    other = await user_factory("revoke_other")
+    sessions = [user["headers"], await login(ac, user), await login(ac, user)]
+    response = await ac.post("/auth/logout/all/", headers=sessions[0])
+    assert response.status_code == 200
+    for headers in sessions:
+        response = await ac.get("/auth/me/", headers=headers)
+        assert response.status_code == 401
+
+    # iat has whole-second precision, so the cut-off revokes every token issued up to and
+    # including the logout second; a fresh login in a later second works again
+    await asyncio.sleep(CUT_OFF_PRECISION)
+    response = await ac.get("/auth/me/", headers=await login(ac, user))
+    assert response.status_code == 200
+    response = await ac.get("/auth/me/", headers=other["headers"])
+    assert response.status_code == 200
+
+
+async def test_revocation_check_confirms_hits(db, isolated, ac: AsyncClient, user_factory):
+    user = await user_factory("revoke")
+    jti = token_jti(user["headers"]["Authorization"].split()[1])
+    assert not await revocation_list.is_revoked(db, jti)
+    response = await ac.post("/auth/logout/", headers=user["headers"])
+    assert response.status_code == 200
+    assert await revocation_list.is_revoked(db, jti)
+
+
+async def revoke_one(ac: AsyncClient, user_factory):
+    user = await user_factory("revoke")
+    response = await ac.post("/auth/logout/", headers=user["headers"])
+    assert response.status_code == 200
+
+
+async def test_revocation_fast_path_no_query(db, isolated, ac: AsyncClient, user_factory):
+    await revoke_one(ac, user_factory)
+    counting_db = CountingDatabase(db)
+    for _ in range(FAST_PATH_PROBES):
+        assert not await revocation_list.is_revoked(counting_db, uuid.uuid4().hex)
+
+    # only bloom filter false positives may go to the database, the filter is sized for the
+    # configured rate, the slack keeps an unlucky run from failing
+    expected = FAST_PATH_PROBES * system_config.revocation_false_positive_rate
+    assert counting_db.queries <= max(expected * FALSE_POSITIVE_SLACK, FALSE_POSITIVE_FLOOR)
+
+
+@pytest.mark.benchmark
+async def test_revocation_fast_path_speed(db, isolated, ac: AsyncClient, user_factory):
+    await revoke_one(ac, user_factory)
+    jtis = [uuid.uuid4().hex for _ in range(FAST_PATH_PROBES)]
+    start = time.perf_counter()
+    for jti in jtis:
+        await revocation_list.is_revoked(db, jti)
+    assert (time.perf_counter() - start) / FAST_PATH_PROBES < FAST_PATH_LIMIT
+
+
+async def test_revocation_refresh_is_incremental(db, isolated, ac: AsyncClient, user_factory):
+    # a second list stands in for another process that missed the logout
+    other_process = RevocationList()
+    await other_process.refresh(db)
+    user = await user_factory("revoke")
+    jti = token_jti(user["headers"]["Authorization"].split()[1])
+    response = await ac.post("/auth/logout/", headers=user["headers"])
+    assert response.status_code == 200
+
+    counting_db = CountingDatabase(db)
+    await other_process.refresh(counting_db)
+    assert counting_db.queries == 1
+    assert await other_process.is_revoked(db, jti)
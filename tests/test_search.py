@@ -0,0 +1,104 @@
+import pytest
+
+from httpx import AsyncClient
+
+
+QZEBRA_MATCHES = 4
+
+
+@pytest.fixture(scope='module')
+async def searcher(user_factory) -> dict:
+    return await user_factory("search")
+
+
+@pytest.fixture(scope='module')
+async def search_users(db, users_table):
+    rows = [
+        {"user_email": "qzebra@search.com", "user_name": "Qzebra", "user_password": "search_hash"},
+        {"user_email": "qzebrafish@search.com", "user_name": "qzebrafish", "user_password": "search_hash"},
+        {"user_email": "alpha@search.com", "user_name": "alpha_qzebra", "user_password": "search_hash"},
+        {"user_email": "mail_qzebra@search.com", "user_name": "beta", "user_password": "search_hash"},
+        {"user_email": "other@search.com", "user_name": "other", "user_password": "search_hash"},
+    ]
+    await db.execute(users_table.insert().values(rows))
+    yield rows
+    await db.execute(users_table.delete().where(users_table.c.user_email.like("%@search.com")))
+
+
+@pytest.fixture(scope='module')
+async def search_companies(db, companies_table, search_users, user_factory):
+    owner = await user_factory("search_owner")
+    rows = [
+        {"company_name": "Qgiraffe works", "company_description": None},
+        {"company_name": "tall animals", "company_description": "home of the qgiraffe"},
+        {"company_name": "short animals", "company_description": "no such animal"},
+    ]
+    await db.execute(companies_table.insert().values([{**row, "company_owner_id": owner["user_id"]} for row in rows]))
+    yield rows
+    await db.execute(companies_table.delete().where(companies_table.c.company_name.in_([row["company_name"] for row in rows])))
+
+
+async def test_search_users_unauth(ac: AsyncClient):
+    response = await ac.get("/users/search", params={"q": "qzebra"})
+    assert response.status_code == 403
+
+
+async def test_search_users_no_query(ac: AsyncClient, searcher):
+    headers = searcher["headers"]
+    response = await ac.get("/users/search", params={"q": ""}, headers=headers)
+    assert response.status_code == 422
+
+
+async def test_search_users_ranked(ac: AsyncClient, searcher, search_users):
+    headers = searcher["headers"]
+    response = await ac.get("/users/search", params={"q": "qzebra"}, headers=headers)
+    assert response.status_code == 200
+    users = response.json().get("result").get("users")
+    names = [user.get("user_name") for user in users]
+    assert sorted(names) == sorted(["Qzebra", "qzebrafish", "alpha_qzebra", "beta"])
+    assert set(names[:2]) == {"Qzebra", "qzebrafish"}
+    assert all(user.get("user_password") is None for user in users)
+
+
+async def test_search_users_email(ac: AsyncClient, searcher, search_users):
+    headers = searcher["headers"]
+    response = await ac.get("/users/search", params={"q": "mail_qz"}, headers=headers)
+    assert response.status_code == 200
+    users = response.json().get("result").get("users")
+    assert [user.get("user_email") for user in users] == ["mail_qzebra@search.com"]
+
+
+async def test_search_users_paginated(ac: AsyncClient, searcher, search_users):
+    headers = searcher["headers"]
+    names = []
+    params = {"q": "qzebra", "limit": 1}
+    # one match per page, plus a spare for an empty last page
+    for _ in range(QZEBRA_MATCHES + 1):
+        response = await ac.get("/users/search", params=params, headers=headers)
+        assert response.status_code == 200
+        result = response.json().get("result")
+        assert len(result.get("users")) <= 1
+        names += [user.get("user_name") for user in result.get("users")]
+        if result.get("next_cursor") is None:
+            break
+        params = {"q": "qzebra", "limit": 1, "cursor": result.get("next_cursor")}
+    else:
+        pytest.fail("/users/search still had a next_cursor after every match was listed")
+    assert len(names) == QZEBRA_MATCHES
+    assert len(set(names)) == QZEBRA_MATCHES
+
+
+async def test_search_companies(ac: AsyncClient, searcher, search_companies):
+    headers = searcher["headers"]
+    response = await ac.get("/companies/search", params={"q": "qgiraffe"}, headers=headers)
+    assert response.status_code == 200
+    companies = response.json().get("result").get("companies")
+    assert [company.get("company_name") for company in companies] == ["Qgiraffe works", "tall animals"]
+
+
+async def test_search_companies_no_match(ac: AsyncClient, searcher, search_companies):
+    headers = searcher["headers"]
+    response = await ac.get("/companies/search", params={"q": "qunicorn"}, headers=headers)
+    assert response.status_code == 200
+    assert response.json().get("result").get("companies") == []
+    assert response.json().get("result").get("next_cursor") is None
@@ -0,0 +1,47 @@
+import time
+
+import asyncpg
+import pytest
+
+from core.config import system_config
+from tests import seed
+
+
+TEMPLATE = "seed_test_template"
+CLONE = "seed_test_clone"
+TEMPLATE_USERS = 20_000
+TEMPLATE_COMPANIES = 1_000
+CLONE_LIMIT = 1.0
+
+
+@pytest.fixture(scope='module')
+async def template():
+    # builds and clones real databases, so it needs CREATEDB and runs only with -m benchmark
+    await seed.build_template(TEMPLATE, TEMPLATE_USERS, TEMPLATE_COMPANIES)
+    yield TEMPLATE
+    await seed.drop_database(CLONE)
+    await seed.drop_database(TEMPLATE)
+
+
+@pytest.mark.benchmark
+async def test_seed_clone_is_fast(template):
+    start = time.perf_counter()
+    await seed.create_database(CLONE, template)
+    assert time.perf_counter() - start < CLONE_LIMIT
+
+
+@pytest.mark.benchmark
+async def test_seed_clone_has_rows(template):
+    await seed.create_database(CLONE, template)
+    connection = await asyncpg.connect(seed.asyncpg_dsn(seed.database_url(system_config.db_url_test, CLONE)))
+    try:
+        assert await seed.count_users(connection, seed.TEMPLATE_PREFIX) == TEMPLATE_USERS
+        companies_table = seed.find_table("company_name")
+        assert await connection.fetchval(f'SELECT count(*) FROM "{companies_table.name}"') == TEMPLATE_COMPANIES
+    finally:
+        await connection.close()
+
+
+async def test_seed_copy_users(raw_connection, isolated):
+    await seed.copy_users(raw_connection, "copy", 1_000)
+    assert await seed.count_users(raw_connection, "copy") == 1_000